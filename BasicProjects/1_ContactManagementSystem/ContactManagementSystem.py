@@ -1,13 +1,123 @@
 # New python project
 
+import io
 import os
 import re
+import sys
 import csv
+import mmap
+import bisect
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass, field
 
 # --- Constants ---
 DATABASE_FILE = "database.txt"
 CSV_EXPORT_FILE = "contacts_export.csv"
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB buffer for full database rewrites and exports
 VALID_GROUPS = ["Home", "Office"]  # Valid categories for contact groups
+# Maps lowercased group input to one shared (interned) canonical spelling
+_CANONICAL_GROUPS = {g.lower(): sys.intern(g) for g in VALID_GROUPS}
+# Basic regex for email format: checks for @ and at least one . after @
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# --- Contact Record ---
+
+
+@dataclass(slots=True)
+class Contact:
+    """
+    A single contact. Slots keep each record compact and attribute access fast.
+    `name_lower` caches `name.lower()` for sorting, searching and duplicate checks;
+    it must be reassigned whenever `name` changes.
+    """
+
+    name: str
+    contact_num: str
+    email: str
+    group: str
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
+
+    def to_row(self) -> tuple[str, str, str, str]:
+        """Returns the fields in database/CSV column order."""
+        return (self.name, self.contact_num, self.email, self.group)
+
+
+# --- Helper Functions ---
+
+
+def _sort_key(contact: Contact) -> str:
+    """Returns the cached lowercase name used to order contacts."""
+    return contact.name_lower
+
+
+def _canonical_group(group: str) -> str:
+    """
+    Returns the canonical spelling of a group (e.g. "home" -> "Home").
+    Every contact in a group then shares a single string object.
+    Unknown groups (e.g. from a hand-edited file) are kept as they are, interned.
+    """
+    return _CANONICAL_GROUPS.get(group.lower()) or sys.intern(group)
+
+
+def _validate_name(value: str) -> bool:
+    """Any non-empty name is accepted."""
+    return True
+
+
+def _validate_contact(value: str) -> bool:
+    """Checks that a contact number is all digits, warning if it looks short."""
+    if not value.isdigit():  # Check if all characters are digits
+        print("Error: Contact number must contain only digits.")
+        return False
+    if len(value) < 7:  # Simple check for a reasonable minimum length
+        print("Warning: Contact number seems short. Please check its validity.")
+    return True
+
+
+def _validate_email(value: str) -> bool:
+    """Checks that an email address matches the basic email pattern."""
+    if not _EMAIL_RE.match(value):
+        print("Error: Invalid email format. (e.g., user@example.com)")
+        return False
+    return True
+
+
+def _validate_group(value: str) -> bool:
+    """Checks that a group is one of VALID_GROUPS (case-insensitive)."""
+    if value.lower() not in _CANONICAL_GROUPS:
+        print(f"Error: Invalid group. Please choose from {', '.join(VALID_GROUPS)}.")
+        return False
+    return True
+
+
+# Per-field validators used by ContactManager._validate_input
+_VALIDATORS = {
+    "Name": _validate_name,
+    "Contact": _validate_contact,
+    "Email": _validate_email,
+    "Group": _validate_group,
+}
+
+
+def _insort_contact(sorted_contacts: list[Contact], contact: Contact):
+    """Inserts a contact into a list kept ordered by lowercase name."""
+    bisect.insort(sorted_contacts, contact, key=_sort_key)
+
+
+def _remove_sorted_contact(sorted_contacts: list[Contact], contact: Contact):
+    """
+    Removes a contact from a list kept ordered by lowercase name.
+    Binary search finds the run of equal names, then the exact record is located by identity.
+    """
+    i = bisect.bisect_left(sorted_contacts, contact.name_lower, key=_sort_key)
+    while sorted_contacts[i] is not contact:
+        i += 1
+    del sorted_contacts[i]
+
 
 # --- ContactManager Class ---
 
@@ -23,7 +133,14 @@ class ContactManager:
                 stored.
         """
         self.database_file = database_file
-        self.contacts: list[dict] = []  # Stores contacts as a list of dictionaries
+        self.contacts: list[Contact] = []  # Stores contacts as a list of Contact records
+        # Maps (lowercased Name, Contact) to the contact's position in self.contacts
+        self._index: dict[tuple[str, str], int] = {}
+        # The same contacts kept ordered by their cached "name_lower" for display
+        self._sorted: list[Contact] = []
+        # Sorted contacts bucketed by canonical Group, for group searches
+        self._by_group: dict[str, list[Contact]] = defaultdict(list)
+        self._dirty = False  # True when in-memory edits haven't been written yet
         self._load_contacts()  # Load existing contacts when the manager is created
 
     def _load_contacts(self):
@@ -33,6 +150,9 @@ class ContactManager:
         Includes basic error handling for file reading issues.
         """
         self.contacts = []  # Start with an empty list before loading
+        self._index = {}
+        self._sorted = []
+        self._by_group = defaultdict(list)
         if not os.path.exists(self.database_file):
             print(
                 f"Database file '{self.database_file}' not found. A new one will be created upon first save."
@@ -40,28 +160,43 @@ class ContactManager:
             return  # No file means no contacts to load yet
 
         try:
-            with open(self.database_file, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(
-                    f, 1
-                ):  # Enumerate for line number in warnings
-                    line = line.strip()  # Remove leading/trailing whitespace
-                    if line:  # Process non-empty lines
-                        parts = line.split(",")  # Split by comma
-                        if (
-                            len(parts) == 4
-                        ):  # Expecting 4 parts: Name, Contact, Email, Group
-                            self.contacts.append(
-                                {
-                                    "Name": parts[0],
-                                    "Contact": parts[1],
-                                    "Email": parts[2],
-                                    "Group": parts[3],
-                                }
-                            )
-                        else:
+            with open(self.database_file, "rb") as f:
+                # Map the file and decode it in one pass rather than line by line
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        text = str(mm, "utf-8")
+                else:
+                    text = ""  # mmap can't map an empty file
+            # csv decides where records end (quoted fields may contain commas or newlines);
+            # str.splitlines() would also break on characters like '\x85', '\x0c' or U+2028
+            reader = csv.reader(io.StringIO(text, newline=""))
+            for parts in reader:
+                if parts:  # Process non-empty rows
+                    if (
+                        len(parts) == 4
+                    ):  # Expecting 4 parts: Name, Contact, Email, Group
+                        contact = Contact(
+                            parts[0],
+                            parts[1],
+                            parts[2],
+                            _canonical_group(parts[3]),
+                        )
+                        key = (contact.name_lower, contact.contact_num)
+                        if key in self._index:
                             print(
-                                f"Warning: Skipping malformed line {line_num} in '{self.database_file}': '{line}'. Expected 4 comma-separated values."
+                                f"Warning: Skipping duplicate line {reader.line_num} in '{self.database_file}': '{','.join(parts)}'."
                             )
+                            continue
+                        self._index[key] = len(self.contacts)
+                        self.contacts.append(contact)
+                    else:
+                        print(
+                            f"Warning: Skipping malformed line {reader.line_num} in '{self.database_file}': '{','.join(parts)}'. Expected 4 comma-separated values."
+                        )
+            # Sort once after loading instead of inserting line by line
+            self._sorted = sorted(self.contacts, key=_sort_key)
+            for contact in self._sorted:  # Buckets inherit the sorted order
+                self._by_group[contact.group].append(contact)
             print(
                 f"Contacts loaded successfully from '{self.database_file}'. Total: {len(self.contacts)}."
             )
@@ -71,24 +206,39 @@ class ContactManager:
             self.contacts = (
                 []
             )  # Clear contacts to prevent working with potentially corrupted data
+            self._index = {}
+            self._sorted = []
+            self._by_group = defaultdict(list)
         except Exception as e:
             # Catch any other unexpected errors during loading
             print(f"An unexpected error occurred while loading contacts: {e}")
             self.contacts = []
+            self._index = {}
+            self._sorted = []
+            self._by_group = defaultdict(list)
 
     def _save_contacts(self):
         """
         Saves the current list of contacts from memory back to the database file.
-        Overwrites the existing file with the current state of contacts.
+        Writes to a temporary file first, then atomically replaces the database file,
+        so a crash mid-save never leaves a truncated database behind.
         Includes basic error handling for file writing issues.
         """
+        temp_file = self.database_file + ".tmp"
         try:
-            with open(self.database_file, "w", encoding="utf-8") as f:
-                for contact in self.contacts:
-                    # Write each contact as a comma-separated line
-                    f.write(
-                        f"{contact['Name']},{contact['Contact']},{contact['Email']},{contact['Group']}\n"
-                    )
+            # A large buffer lets the rows reach the disk in a few big writes on close
+            with open(
+                temp_file,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=IO_BUFFER_SIZE,
+            ) as f:
+                # Write each contact as a CSV row (quoting fields that contain commas)
+                csv.writer(f, lineterminator="\n").writerows(
+                    c.to_row() for c in self.contacts
+                )
+            os.replace(temp_file, self.database_file)  # Atomic rename over the old file
             # print(f"Contacts saved to '{self.database_file}'.")  # Uncomment for debugging
         except IOError as e:
             # Catch file I/O errors (e.g., disk full, permission issues)
@@ -97,6 +247,53 @@ class ContactManager:
             # Catch any other unexpected errors during saving
             print(f"An unexpected error occurred while saving contacts: {e}")
 
+    def save_pending_changes(self):
+        """
+        Writes the database file if updates or deletions are pending.
+        Mutations only mark the manager dirty, so several edits in a row
+        cost a single full rewrite.
+        """
+        if self._dirty:
+            self._save_contacts()
+            self._dirty = False
+
+    def _append_contact(self, contact: Contact):
+        """
+        Appends a single contact to the end of the database file.
+        Used when adding, so a new contact doesn't require rewriting the whole file.
+
+        Args:
+            contact (Contact): The contact to append.
+        """
+        try:
+            with open(self.database_file, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f, lineterminator="\n").writerow(contact.to_row())
+        except IOError as e:
+            print(f"Error writing to database file '{self.database_file}': {e}")
+        except Exception as e:
+            print(f"An unexpected error occurred while saving contact: {e}")
+
+    def _add_to_views(self, contact: Contact):
+        """
+        Inserts a contact into the sorted view and its group bucket,
+        keeping both ordered by name.
+
+        Args:
+            contact (Contact): The contact to insert.
+        """
+        _insort_contact(self._sorted, contact)
+        _insort_contact(self._by_group[contact.group], contact)
+
+    def _remove_from_views(self, contact: Contact):
+        """
+        Removes a contact from the sorted view and its group bucket.
+
+        Args:
+            contact (Contact): The contact to remove.
+        """
+        _remove_sorted_contact(self._sorted, contact)
+        _remove_sorted_contact(self._by_group[contact.group], contact)
+
     def _is_contact_duplicate(self, name: str, contact_num: str) -> bool:
         """
         Checks if a contact with the same Name (case-insensitive) and
@@ -109,13 +306,7 @@ class ContactManager:
         Returns:
             bool: True if a duplicate is found, False otherwise.
         """
-        for existing_contact in self.contacts:
-            if (
-                existing_contact["Name"].lower() == name.lower()
-                and existing_contact["Contact"] == contact_num
-            ):
-                return True
-        return False
+        return (name.lower(), contact_num) in self._index
 
     def _validate_input(self, field_name: str, value: str) -> bool:
         """
@@ -134,41 +325,55 @@ class ContactManager:
             print(f"Error: {field_name} cannot be empty.")
             return False
 
-        if field_name == "Contact":
-            if not value.isdigit():  # Check if all characters are digits
-                print("Error: Contact number must contain only digits.")
-                return False
-            if len(value) < 7:  # Simple check for a reasonable minimum length
-                print("Warning: Contact number seems short. Please check its validity.")
-        elif field_name == "Email":
-            # Basic regex for email format: checks for @ and at least one . after @
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", value):
-                print("Error: Invalid email format. (e.g., user@example.com)")
-                return False
-        elif field_name == "Group":
-            if value not in VALID_GROUPS:
-                print(
-                    f"Error: Invalid group. Please choose from {', '.join(VALID_GROUPS)}."
-                )
-                return False
-        return True  # Input is valid for the specified field
+        # Dispatch to the field's validator with a single dict lookup
+        return _VALIDATORS[field_name](value)
 
-    def _display_single_contact(self, contact: dict, index: int | None = None):
+    def _format_contact(self, contact: Contact, index: int | None = None) -> str:
         """
-        Prints a single contact's details in a formatted way.
+        Formats a single contact's details as one display block.
         Optionally includes an index for user reference.
 
         Args:
-            contact (dict): The contact dictionary to display.
+            contact (Contact): The contact to format.
             index (int | None): An optional 1-based index to display before the contact.
+
+        Returns:
+            str: The formatted block, ending with a separator line.
         """
         prefix = f"Contact {index}:" if index is not None else ""
-        print(f"\n{prefix}")
-        print(f"  Name: {contact['Name']}")
-        print(f"  Contact: {contact['Contact']}")
-        print(f"  Email: {contact['Email']}")
-        print(f"  Group: {contact['Group']}")
-        print("-" * 30)  # Separator for readability
+        return (
+            f"\n{prefix}\n"
+            f"  Name: {contact.name}\n"
+            f"  Contact: {contact.contact_num}\n"
+            f"  Email: {contact.email}\n"
+            f"  Group: {contact.group}\n"
+            f"{'-' * 30}\n"  # Separator for readability
+        )
+
+    def _display_single_contact(self, contact: Contact, index: int | None = None):
+        """
+        Prints a single contact's details in a formatted way, with one write.
+
+        Args:
+            contact (Contact): The contact to display.
+            index (int | None): An optional 1-based index to display before the contact.
+        """
+        sys.stdout.write(self._format_contact(contact, index))
+
+    def _display_contacts(self, contacts: list[Contact]):
+        """
+        Prints a list of contacts with 1-based IDs.
+        The whole listing is built first and written in a single call.
+
+        Args:
+            contacts (list[Contact]): The contacts to display, in display order.
+        """
+        sys.stdout.write(
+            "".join(
+                self._format_contact(contact, i + 1)
+                for i, contact in enumerate(contacts)
+            )
+        )
 
     def add_contact(self):
         """
@@ -205,40 +410,61 @@ class ContactManager:
             )
             return
 
-        # Create the new contact dictionary
-        new_contact = {
-            "Name": name,
-            "Contact": contact_num,
-            "Email": email,
-            "Group": group,
-        }
+        # Create the new contact record (which caches the lowercase name once)
+        new_contact = Contact(name, contact_num, email, _canonical_group(group))
 
+        self._index[(new_contact.name_lower, contact_num)] = len(self.contacts)
         self.contacts.append(new_contact)  # Add to the in-memory list
-        self._save_contacts()  # Save the updated list to file
+        self._add_to_views(new_contact)
+        self._append_contact(new_contact)  # Append just the new contact to file
         print("Contact added successfully!")
 
-    def view_all_contacts(self, sorted_by_name: bool = True):
+    def _get_display_list(
+        self, sorted_by_name: bool = True, limit: int | None = None
+    ) -> list[Contact]:
+        """
+        Returns the contacts in display order, so the same list can be shown
+        and then indexed by the 1-based IDs it was shown with.
+
+        Args:
+            sorted_by_name (bool): If True, contacts are ordered alphabetically by name.
+            limit (int | None): If given, only the first `limit` contacts are returned.
+
+        Returns:
+            list[Contact]: The contacts to display.
+        """
+        # Use the maintained sorted view if requested
+        display_list = self._sorted if sorted_by_name else self.contacts
+        if limit is not None and limit < len(display_list):
+            # The view is already in order, so the first page is a plain slice
+            display_list = display_list[:limit]
+        return display_list
+
+    def view_all_contacts(
+        self, sorted_by_name: bool = True, limit: int | None = None
+    ) -> list[Contact]:
         """
         Displays all contacts currently loaded, optionally sorted by name.
         Each contact is displayed with a 1-based ID for user reference.
 
         Args:
             sorted_by_name (bool): If True, contacts are displayed sorted alphabetically by name.
+            limit (int | None): If given, only the first `limit` contacts are displayed.
+
+        Returns:
+            list[Contact]: The displayed contacts, in the order their IDs refer to.
         """
         print("\n--- All Contacts ---")
         if not self.contacts:
             print("No contacts found in the database. Add some first!")
-            return
+            return []
 
-        # Create a display list, sorted if requested
-        display_list = (
-            sorted(self.contacts, key=lambda c: c["Name"].lower())
-            if sorted_by_name
-            else self.contacts
-        )
+        display_list = self._get_display_list(sorted_by_name, limit)
 
-        for i, contact in enumerate(display_list):
-            self._display_single_contact(contact, i + 1)  # Display with 1-based index
+        self._display_contacts(display_list)  # Display with 1-based index
+        if len(display_list) < len(self.contacts):
+            print(f"Showing {len(display_list)} of {len(self.contacts)} contacts.")
+        return display_list
 
     def view_specific_contact_by_id(self):
         """
@@ -251,7 +477,7 @@ class ContactManager:
             return
 
         # First, display all contacts so the user knows the IDs
-        self.view_all_contacts(sorted_by_name=True)  # Display sorted list with IDs
+        display_list = self.view_all_contacts(sorted_by_name=True)
 
         try:
             idx_input = input("Enter the ID number of the contact to view: ").strip()
@@ -262,17 +488,16 @@ class ContactManager:
             contact_id = int(idx_input)  # Convert input to integer
 
             # Validate if the ID is within the valid range of displayed contacts
-            if 1 <= contact_id <= len(self.contacts):
-                # Since view_all_contacts shows a sorted list, we need to pick from that
-                sorted_contacts = sorted(self.contacts, key=lambda c: c["Name"].lower())
-                selected_contact = sorted_contacts[
+            if 1 <= contact_id <= len(display_list):
+                # Pick from the exact list that was displayed
+                selected_contact = display_list[
                     contact_id - 1
                 ]  # Adjust for 0-based indexing
                 print("\n--- Details for Selected Contact ---")
                 self._display_single_contact(selected_contact)
             else:
                 print(
-                    f"Invalid ID '{contact_id}'. Please enter a number within the displayed range (1 to {len(self.contacts)})."
+                    f"Invalid ID '{contact_id}'. Please enter a number within the displayed range (1 to {len(display_list)})."
                 )
         except ValueError:
             print("Invalid input. Please enter a whole number for the ID.")
@@ -290,23 +515,24 @@ class ContactManager:
             print("Search prefix cannot be empty.")
             return
 
-        # Filter contacts that match the prefix
-        found_contacts = [
-            contact
-            for contact in self.contacts
-            if contact["Name"].lower().startswith(search_name_prefix.lower())
-        ]
+        # Binary search the sorted view for the first match, then take the
+        # contiguous run of names sharing the prefix
+        prefix_lower = search_name_prefix.lower()
+        start = bisect.bisect_left(self._sorted, prefix_lower, key=_sort_key)
+        found_contacts = list(
+            itertools.takewhile(
+                lambda c: c.name_lower.startswith(prefix_lower),
+                itertools.islice(self._sorted, start, None),
+            )
+        )
 
         if not found_contacts:
             print(f"No contacts found starting with '{search_name_prefix}'.")
             return
 
         print(f"\nContacts found starting with '{search_name_prefix}':")
-        # Display found contacts, sorted by name
-        for i, contact in enumerate(
-            sorted(found_contacts, key=lambda c: c["Name"].lower())
-        ):
-            self._display_single_contact(contact, i + 1)
+        # Display found contacts, already sorted by name
+        self._display_contacts(found_contacts)
 
     def search_by_group(self):
         """
@@ -321,23 +547,16 @@ class ContactManager:
         if not self._validate_input("Group", group_input):
             return
 
-        # Filter contacts that belong to the specified group
-        found_contacts = [
-            contact
-            for contact in self.contacts
-            if contact["Group"].lower() == group_input.lower()
-        ]
+        # Fetch the group's bucket, which is already sorted by name
+        found_contacts = self._by_group.get(_canonical_group(group_input), [])
 
         if not found_contacts:
             print(f"No contacts found in the '{group_input}' group.")
             return
 
         print(f"\nContacts found in '{group_input}' group:")
-        # Display found contacts, sorted by name
-        for i, contact in enumerate(
-            sorted(found_contacts, key=lambda c: c["Name"].lower())
-        ):
-            self._display_single_contact(contact, i + 1)
+        # Display found contacts, already sorted by name
+        self._display_contacts(found_contacts)
 
     def update_contact(self):
         """
@@ -358,17 +577,11 @@ class ContactManager:
             "Enter the Contact Number of the contact to update: "
         ).strip()
 
-        target_index = -1
         # Find the actual index of the contact in the internal (unsorted) list
-        for i, contact in enumerate(self.contacts):
-            if (
-                contact["Name"].lower() == name_to_find.lower()
-                and contact["Contact"] == contact_num_to_find
-            ):
-                target_index = i
-                break
-
-        if target_index == -1:
+        old_key = (name_to_find.lower(), contact_num_to_find)
+        target_index = self._index.get(old_key)
+
+        if target_index is None:
             print(
                 f"No contact found with Name '{name_to_find}' and Contact '{contact_num_to_find}'."
             )
@@ -383,35 +596,64 @@ class ContactManager:
         print("Enter new values (leave blank to keep current value):")
 
         # Prompt for new values, providing current value as a hint
-        new_name = input(f"New Name (current: '{contact_to_update['Name']}'): ").strip()
+        new_name = input(f"New Name (current: '{contact_to_update.name}'): ").strip()
         new_contact_num = input(
-            f"New Contact (current: '{contact_to_update['Contact']}'): "
+            f"New Contact (current: '{contact_to_update.contact_num}'): "
         ).strip()
         new_email = input(
-            f"New Email (current: '{contact_to_update['Email']}'): "
+            f"New Email (current: '{contact_to_update.email}'): "
         ).strip()
         new_group = input(
-            f"New Group (current: '{contact_to_update['Group']}', options: {', '.join(VALID_GROUPS)}): "
+            f"New Group (current: '{contact_to_update.group}', options: {', '.join(VALID_GROUPS)}): "
         ).strip()
 
         updated_flag = False  # Flag to track if any field was actually updated
 
+        # Validate the identifying fields first so the new key can be checked
+        name_valid = bool(new_name) and self._validate_input("Name", new_name)
+        contact_valid = bool(new_contact_num) and self._validate_input(
+            "Contact", new_contact_num
+        )
+        proposed_name = new_name if name_valid else contact_to_update.name
+        proposed_name_lower = (
+            new_name.lower() if name_valid else contact_to_update.name_lower
+        )
+        proposed_contact = (
+            new_contact_num if contact_valid else contact_to_update.contact_num
+        )
+        new_key = (proposed_name_lower, proposed_contact)
+        if new_key != old_key and new_key in self._index:
+            print(
+                f"Error: A contact with Name '{proposed_name}' and Contact '{proposed_contact}' already exists."
+            )
+            return
+
+        # Take the contact out of the sorted views while its Name/Group may change
+        self._remove_from_views(contact_to_update)
+
         # Update fields only if new value is provided and valid
-        if new_name and self._validate_input("Name", new_name):
-            contact_to_update["Name"] = new_name
+        if name_valid:
+            contact_to_update.name = new_name
+            contact_to_update.name_lower = proposed_name_lower
             updated_flag = True
-        if new_contact_num and self._validate_input("Contact", new_contact_num):
-            contact_to_update["Contact"] = new_contact_num
+        if contact_valid:
+            contact_to_update.contact_num = new_contact_num
             updated_flag = True
         if new_email and self._validate_input("Email", new_email):
-            contact_to_update["Email"] = new_email
+            contact_to_update.email = new_email
             updated_flag = True
         if new_group and self._validate_input("Group", new_group):
-            contact_to_update["Group"] = new_group
+            contact_to_update.group = _canonical_group(new_group)
             updated_flag = True
 
+        self._add_to_views(contact_to_update)
+
         if updated_flag:
-            self._save_contacts()  # Save changes to file
+            if new_key != old_key:
+                # Keep the index in sync when the identifying fields change
+                del self._index[old_key]
+                self._index[new_key] = target_index
+            self._dirty = True  # Saved when returning to the main menu
             print("Contact updated successfully!")
         else:
             print("No changes were made or invalid input provided for updates.")
@@ -431,29 +673,27 @@ class ContactManager:
         name_to_delete = input("Enter Name of contact to delete: ").strip()
         contact_to_delete = input("Enter Contact Number of contact to delete: ").strip()
 
-        initial_count = len(
-            self.contacts
-        )  # Store initial count to check if deletion occurred
-
-        # Create a new list containing only contacts that DO NOT match the deletion criteria.
-        # This is a safe way to remove items while iterating.
-        self.contacts = [
-            contact
-            for contact in self.contacts
-            if not (
-                contact["Name"].lower() == name_to_delete.lower()
-                and contact["Contact"] == contact_to_delete
-            )
-        ]
+        key = (name_to_delete.lower(), contact_to_delete)
+        target_index = self._index.pop(key, None)
 
-        if len(self.contacts) == initial_count:
-            # If the list length hasn't changed, no matching contact was found
+        if target_index is None:
             print(
                 f"No contact found with Name '{name_to_delete}' and Contact '{contact_to_delete}'."
             )
-        else:
-            self._save_contacts()  # Save the modified list to file
-            print("Contact(s) deleted successfully!")
+            return
+
+        self._remove_from_views(self.contacts[target_index])
+
+        # Move the last contact into the freed slot so removal is O(1)
+        last_contact = self.contacts.pop()
+        if target_index < len(self.contacts):
+            self.contacts[target_index] = last_contact
+            self._index[(last_contact.name_lower, last_contact.contact_num)] = (
+                target_index
+            )
+
+        self._dirty = True  # Saved when returning to the main menu
+        print("Contact deleted successfully!")
 
     def export_contacts_to_csv(self, filename: str = CSV_EXPORT_FILE):
         """
@@ -470,14 +710,19 @@ class ContactManager:
 
         try:
             # Open the file in write mode, with newline='' to prevent extra blank rows in CSV
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                fieldnames = ["Name", "Contact", "Email", "Group"]  # Define CSV header
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()  # Write the first row (headers)
+            with open(
+                filename,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=IO_BUFFER_SIZE,
+            ) as csvfile:
+                writer = csv.writer(csvfile)
+
+                writer.writerow(("Name", "Contact", "Email", "Group"))  # CSV header
                 writer.writerows(
-                    self.contacts
-                )  # Write all contact dictionaries as rows
+                    contact.to_row() for contact in self.contacts
+                )  # Write all contacts as rows, straight from their tuples
 
             print(f"Contacts successfully exported to '{filename}'!")
         except IOError as e:
@@ -498,7 +743,22 @@ def main_menu():
         ContactManager()
     )  # Create an instance of the ContactManager, which loads data
 
+    try:
+        _run_menu_loop(manager)
+    finally:
+        manager.save_pending_changes()  # Never exit with unsaved edits
+
+
+def _run_menu_loop(manager: ContactManager):
+    """
+    Runs the interactive menu until the user chooses to exit.
+
+    Args:
+        manager (ContactManager): The manager whose methods the menu calls.
+    """
     while True:
+        manager.save_pending_changes()  # Flush edits made by the previous action
+
         print("\n--- Contact Management System Menu ---")
         print("1. Add New Contact")
         print("2. View All Contacts (Sorted by Name)")
@@ -1,16 +1,49 @@
+import io
 import os
+import csv
+import sys
+import atexit
+import heapq
+import pathlib
 import datetime  # For handling dates and times
+from functools import lru_cache
+from typing import Iterable
 
 
 # --- Configuration ---
 TASK_FILE = 'tasks.txt'
+# When pending changes are written (and fsynced) to disk:
+#   'always' - after every change, 'batch' - every SYNC_EVERY changes, 'exit' - only when the app exits
+SYNC_POLICIES = ('always', 'batch', 'exit')
+SYNC_EVERY = 16
 # The format for each line in the task file will be:
 # ID,Description,IsCompleted,CreationDateTime,DeadlineDateTime
+# Lines are CSV, so a description containing commas is written in double quotes.
 # Example: 1,Buy groceries,False,2024-06-16 16:00:00.000000,2024-06-17 23:59:00.000000
 
 # --- Helper Functions for Time Handling ---
 
 
+def _parse_fixed_datetime(value: str) -> datetime.datetime:
+    """
+    Parses a 'YYYY-MM-DD HH:MM' string. Same result as strptime(value, '%Y-%m-%d %H:%M'),
+    but the fixed-width fields are sliced out directly instead of going through strptime.
+
+    Args:
+        value (str): The date/time string to parse.
+
+    Returns:
+        datetime.datetime: The parsed datetime object.
+
+    Raises:
+        ValueError: If the string is not a valid date and time.
+    """
+    if (len(value) == 16 and value[4] == '-' and value[7] == '-' and value[10] == ' ' and value[13] == ':'
+            and (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16]).isdigit()):
+        # datetime() itself rejects out-of-range fields such as month 13
+        return datetime.datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]))
+    return datetime.datetime.strptime(value, '%Y-%m-%d %H:%M') # Unpadded input like '2024-1-5 9:30' keeps strptime's rules
+
 def _parse_datetime_input(prompt: str, optional: bool = False) -> datetime.datetime | None:
     """
     Prompts the user for a date and time, parses it, and returns a datetime object.
@@ -35,13 +68,37 @@ def _parse_datetime_input(prompt: str, optional: bool = False) -> datetime.datet
 
         try:
             # Attempt to parse the input string into a datetime object
-            return datetime.datetime.strptime(user_input, '%Y-%m-%d %H:%M')
+            return _parse_fixed_datetime(user_input)
         except ValueError:
             print("Invalid date/time format. Please use YYYY-MM-DD HH:MM.")
         except Exception as e:
             print(f"An unexpected error occurred during date/time parsing: {e}")
 
 
+def _fast_iso(value: str) -> datetime.datetime:
+    """
+    Parses a timestamp written by Task.to_row ('YYYY-MM-DDTHH:MM:SS' with optional
+    '.ffffff') by slicing its fixed-width fields. Any other shape goes through
+    datetime.fromisoformat, so hand-edited files still load.
+
+    Args:
+        value (str): The ISO 8601 string to parse.
+
+    Returns:
+        datetime.datetime: The parsed datetime object.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 date and time.
+    """
+    length = len(value)
+    if ((length == 19 or (length == 26 and value[19] == '.' and value[20:].isdigit()))
+            and value[4] == '-' and value[7] == '-' and value[10] == 'T' and value[13] == ':' and value[16] == ':'
+            and (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]).isdigit()):
+        return datetime.datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]),
+                                 int(value[14:16]), int(value[17:19]), int(value[20:]) if length == 26 else 0)
+    return datetime.datetime.fromisoformat(value)
+
+
 def _format_timedelta(delta: datetime.timedelta) -> str:
     """
     Formats a datetime.timedelta object into a human-readable string (e.g., "2 days, 3 hours").
@@ -55,10 +112,31 @@ def _format_timedelta(delta: datetime.timedelta) -> str:
     # Get absolute value of delta for consistent formatting
     total_seconds = int(abs(delta).total_seconds())
 
-    # Calculate days, hours, minutes, seconds
-    days, remainder = divmod(total_seconds, 86400) # 86400 seconds in a day
-    hours, remainder = divmod(remainder, 3600)    # 3600 seconds in an hour
-    minutes, seconds = divmod(remainder, 60)      # 60 seconds in a minute
+    if total_seconds < 60: # Only show seconds if less than a minute
+        if not total_seconds: # If delta is 0 seconds
+            return "0 seconds"
+        return f"{total_seconds} second{'s' if total_seconds != 1 else ''}"
+
+    # Seconds are never shown past the first minute, so whole minutes fully
+    # determine the text and can share one cache entry
+    return _format_minutes(total_seconds // 60)
+
+
+@lru_cache(maxsize=4096)
+def _format_minutes(total_minutes: int) -> str:
+    """
+    Formats a whole number of minutes (at least 1) as days, hours and minutes.
+    Cached, since task lists are re-rendered often with many repeated durations.
+
+    Args:
+        total_minutes (int): The duration in whole minutes.
+
+    Returns:
+        str: A human-readable string such as "2 days, 3 hours".
+    """
+    # Calculate days, hours, minutes
+    days, remainder = divmod(total_minutes, 1440) # 1440 minutes in a day
+    hours, minutes = divmod(remainder, 60)        # 60 minutes in an hour
 
     parts = []
     if days > 0:
@@ -67,11 +145,6 @@ def _format_timedelta(delta: datetime.timedelta) -> str:
         parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
     if minutes > 0:
         parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-    if seconds > 0 and not days and not hours and not minutes: # Only show seconds if less than a minute
-        parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-
-    if not parts: # If delta is 0 seconds
-        return "0 seconds"
     return ", ".join(parts)
 
 
@@ -81,6 +154,10 @@ class Task:
     Represents a single To-Do task with ID, description, completion status,
     creation timestamp, and an optional deadline.
     """
+    # No per-instance __dict__: smaller objects and faster attribute access
+    __slots__ = ('id', 'description', 'is_completed', '_creation_datetime', '_deadline_datetime',
+                 '_creation_iso', '_deadline_iso', '_creation_fmt', '_deadline_fmt')
+
     def __init__(self, task_id: int, description: str, is_completed: bool,
                  creation_datetime: datetime.datetime, deadline_datetime: datetime.datetime | None):
         """
@@ -110,11 +187,40 @@ class Task:
         self.creation_datetime = creation_datetime
         self.deadline_datetime = deadline_datetime
 
-    def get_time_status(self) -> str:
+    # The datetimes are properties so their ISO (saving) and display strings are computed once per change
+    @property
+    def creation_datetime(self) -> datetime.datetime:
+        return self._creation_datetime
+
+    @creation_datetime.setter
+    def creation_datetime(self, value: datetime.datetime):
+        self._creation_datetime = value
+        self._creation_iso = value.isoformat()
+        self._creation_fmt = value.strftime('%Y-%m-%d %H:%M')
+
+    @property
+    def deadline_datetime(self) -> datetime.datetime | None:
+        return self._deadline_datetime
+
+    @deadline_datetime.setter
+    def deadline_datetime(self, value: datetime.datetime | None):
+        self._deadline_datetime = value
+        self._deadline_iso = value.isoformat() if value else None
+        self._deadline_fmt = value.strftime('%Y-%m-%d %H:%M') if value else 'N/A'
+
+    @property
+    def deadline_display(self) -> str:
+        """The deadline as 'YYYY-MM-DD HH:MM', or 'N/A' if there is none."""
+        return self._deadline_fmt
+
+    def get_time_status(self, now: datetime.datetime | None = None) -> str:
         """
         Calculates and returns the time status relative to the deadline.
         Returns strings like "X time left", "X time passed", or "No deadline".
 
+        Args:
+            now (datetime.datetime | None): Reference time; defaults to the current time.
+
         Returns:
             str: A formatted string indicating the time status.
         """
@@ -124,7 +230,8 @@ class Task:
         if self.deadline_datetime is None:
             return "No Deadline Set"
 
-        now = datetime.datetime.now()
+        if now is None:
+            now = datetime.datetime.now()
         time_difference = self.deadline_datetime - now
 
         if time_difference.total_seconds() > 0:
@@ -139,50 +246,70 @@ class Task:
         Returns a human-readable string representation of the Task,
         including its ID, status, description, creation date, and deadline status.
         """
+        return self.render(datetime.datetime.now())
+
+    def render(self, now: datetime.datetime) -> str:
+        """
+        Same as str(task), but relative to the given time, so a caller
+        rendering many tasks can read the clock once.
+
+        Args:
+            now (datetime.datetime): Reference time for the status and time-left text.
+
+        Returns:
+            str: A human-readable string representation of the Task.
+        """
         status_text = ""
         if self.is_completed:
             status_text = "[COMPLETED]"
-        elif self.deadline_datetime and datetime.datetime.now() > self.deadline_datetime:
+        elif self.deadline_datetime and now > self.deadline_datetime:
             status_text = "[OVERDUE]"
         else:
             status_text = "[ACTIVE]"
 
-        creation_str = self.creation_datetime.strftime('%Y-%m-%d %H:%M')
-        deadline_str = self.deadline_datetime.strftime('%Y-%m-%d %H:%M') if self.deadline_datetime else 'N/A'
-        time_status = self.get_time_status()
+        creation_str = self._creation_fmt
+        deadline_str = self._deadline_fmt
+        time_status = self.get_time_status(now)
 
         return (f"ID: {self.id} | Status: {status_text}\n"
                 f"  Description: {self.description}\n"
                 f"  Created On: {creation_str}\n"
                 f"  Deadline: {deadline_str} ({time_status})")
 
-    def to_file_format(self) -> str:
+    def to_row(self) -> tuple[str, str, str, str, str]:
         """
-        Converts the task object into a comma-separated string suitable for saving to file.
+        Converts the task object into a CSV row suitable for saving to file.
         Uses ISO format for datetimes to ensure accurate parsing later.
         """
-        # Convert datetime objects to string; use 'None' string for missing deadline
-        creation_str = self.creation_datetime.isoformat()
-        deadline_str = self.deadline_datetime.isoformat() if self.deadline_datetime else 'None'
-        return f"{self.id},{self.description},{self.is_completed},{creation_str},{deadline_str}"
+        # ISO strings are cached by the datetime setters; use 'None' string for missing deadline
+        return (str(self.id), self.description, 'True' if self.is_completed else 'False',
+                self._creation_iso, self._deadline_iso or 'None')
 
-# --- ToDoListManager Class ---
-class ToDoListManager:
+# --- TaskEngine Class ---
+class TaskEngine:
     """
-    Manages the collection of To-Do tasks, including file operations and various
-    task management functionalities.
+    Owns the collection of To-Do tasks and their storage. Methods take plain
+    arguments and return results instead of prompting, so they can be scripted.
     """
-    def __init__(self, filename: str = TASK_FILE):
+    def __init__(self, filename: str = TASK_FILE, sync_policy: str = 'batch'):
         """
-        Initializes the ToDoListManager. Loads tasks from the specified file.
+        Initializes the TaskEngine. Loads tasks from the specified file.
 
         Args:
             filename (str): The name of the file to store tasks.
+            sync_policy (str): How often changes are saved; one of SYNC_POLICIES.
         """
+        if sync_policy not in SYNC_POLICIES:
+            raise ValueError(f"sync_policy must be one of {SYNC_POLICIES}, got '{sync_policy}'.")
         self.filename = filename
+        self.sync_policy = sync_policy
         self.tasks: list[Task] = []
+        self._by_id: dict[int, Task] = {}  # Same tasks keyed by ID for O(1) lookups
         self._next_id = 1  # Used to generate unique IDs for new tasks
+        self._dirty = False  # True when in-memory changes haven't been saved yet
+        self._ops_since_sync = 0  # Changes made since the last save
         self._load_tasks() # Load tasks when the manager starts
+        atexit.register(self.flush) # Never lose pending changes on exit
 
     def _load_tasks(self):
         """
@@ -190,59 +317,311 @@ class ToDoListManager:
         and malformed lines. Updates _next_id based on the highest existing task ID.
         """
         self.tasks = [] # Clear current tasks before loading
+        self._by_id = {}
         max_id = 0
         if not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0:
             print(f"No existing tasks file found or file '{self.filename}' is empty. Starting with an empty list.")
             return
 
+        # Tasks added in bulk often share timestamps; parse each distinct ISO string once
+        dt_cache: dict[str, datetime.datetime] = {}
+
+        def parse_iso(value: str) -> datetime.datetime:
+            parsed = dt_cache.get(value)
+            if parsed is None:
+                parsed = dt_cache[value] = _fast_iso(value)
+            return parsed
+
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line: # Skip empty lines
-                        continue
-                    parts = line.split(',', 4) # Split into at most 5 parts: ID,Desc,Complete,Created,Deadline
-                    if len(parts) == 5:
-                        try:
-                            task_id = int(parts[0])
-                            description = parts[1]
-                            is_completed = parts[2].lower() == 'true'
-                            creation_dt = datetime.datetime.fromisoformat(parts[3])
-                            # Handle optional deadline
-                            deadline_dt = datetime.datetime.fromisoformat(parts[4]) if parts[4] != 'None' else None
-
-                            task = Task(task_id, description, is_completed, creation_dt, deadline_dt)
-                            self.tasks.append(task)
-                            if task_id > max_id:
-                                max_id = task_id
-                        except (ValueError, IndexError, TypeError) as e:
-                            print(f"Warning: Skipping malformed line {line_num} in '{self.filename}': '{line}' - Error: {e}")
-                    else:
-                        print(f"Warning: Skipping malformed line {line_num} in '{self.filename}': '{line}' - Expected 5 parts, got {len(parts)}.")
+            # Read the whole file in one call, then parse it in memory
+            data = pathlib.Path(self.filename).read_text(encoding='utf-8')
+            reader = csv.reader(io.StringIO(data)) # Handles quoted descriptions containing commas
+            for parts in reader: # ID,Desc,Complete,Created,Deadline
+                if not parts or (len(parts) == 1 and not parts[0].strip()): # Skip empty lines
+                    continue
+                line_num = reader.line_num
+                line = ','.join(parts) # For warning messages
+                if len(parts) == 5:
+                    try:
+                        task_id = int(parts[0])
+                        description = parts[1]
+                        is_completed = parts[2].lower() == 'true'
+                        creation_dt = parse_iso(parts[3])
+                        # Handle optional deadline
+                        deadline_dt = parse_iso(parts[4]) if parts[4] != 'None' else None
+
+                        if task_id in self._by_id:
+                            print(f"Warning: Skipping line {line_num} in '{self.filename}': duplicate task ID {task_id}.")
+                            continue
+                        task = Task(task_id, description, is_completed, creation_dt, deadline_dt)
+                        self.tasks.append(task)
+                        self._by_id[task_id] = task
+                        if task_id > max_id:
+                            max_id = task_id
+                    except (ValueError, IndexError, TypeError) as e:
+                        print(f"Warning: Skipping malformed line {line_num} in '{self.filename}': '{line}' - Error: {e}")
+                else:
+                    print(f"Warning: Skipping malformed line {line_num} in '{self.filename}': '{line}' - Expected 5 parts, got {len(parts)}.")
             self._next_id = max_id + 1
             print(f"Tasks loaded successfully from '{self.filename}'. Next available ID: {self._next_id}")
         except IOError as e:
             print(f"Error loading tasks from '{self.filename}': {e}")
             self.tasks = [] # Clear tasks to prevent corrupted data issues
+            self._by_id = {}
         except Exception as e:
             print(f"An unexpected error occurred while loading tasks: {e}")
             self.tasks = []
+            self._by_id = {}
 
     def _save_tasks(self):
         """
         Saves the current list of tasks to the specified file.
-        Overwrites existing content.
+        Writes a temporary file and swaps it in, so a crash mid-save never
+        leaves a truncated tasks file behind.
         """
+        tmp_filename = self.filename + '.tmp'
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                for task in self.tasks:
-                    f.write(task.to_file_format() + '\n')
+            with open(tmp_filename, 'w', encoding='utf-8', newline='') as f:
+                csv.writer(f, lineterminator='\n').writerows(task.to_row() for task in self.tasks)
+                f.flush()
+                os.fsync(f.fileno()) # Make sure the save actually reached the disk
+            os.replace(tmp_filename, self.filename) # Atomic: readers see the old file or the new one
             # print(f"Tasks saved to '{self.filename}'.") # Uncomment for debugging
         except IOError as e:
             print(f"Error saving tasks to '{self.filename}': {e}")
         except Exception as e:
             print(f"An unexpected error occurred while saving tasks: {e}")
 
+    def _append_task(self, task: Task):
+        """
+        Appends a single task to the end of the file, so adding a task
+        doesn't require rewriting every existing one.
+
+        Args:
+            task (Task): The newly created task to write.
+        """
+        try:
+            with open(self.filename, 'a', encoding='utf-8', newline='') as f:
+                csv.writer(f, lineterminator='\n').writerow(task.to_row())
+        except IOError as e:
+            print(f"Error saving task to '{self.filename}': {e}")
+        except Exception as e:
+            print(f"An unexpected error occurred while saving task: {e}")
+
+    def flush(self):
+        """
+        Saves tasks to the file if there are unsaved changes.
+        Called by _mark_dirty per the sync policy, and always before exiting.
+        """
+        if self._dirty:
+            self._save_tasks()
+            self._dirty = False
+            self._ops_since_sync = 0
+
+    def _mark_dirty(self):
+        """
+        Records an in-memory change and saves once the sync policy says it's time,
+        so a run of edits is group-committed instead of rewriting the file each time.
+        """
+        self._dirty = True
+        self._ops_since_sync += 1
+        if self.sync_policy == 'always' or (self.sync_policy == 'batch' and self._ops_since_sync >= SYNC_EVERY):
+            self.flush()
+
+    def get(self, task_id: int) -> Task | None:
+        """Returns the task with the given ID, or None if there is none."""
+        return self._by_id.get(task_id)
+
+    def add(self, description: str, deadline: datetime.datetime | None = None) -> Task:
+        """
+        Creates a task with the next available ID and the current time as creation time,
+        and appends it to the file.
+
+        Args:
+            description (str): The description of the task.
+            deadline (datetime.datetime | None): The optional deadline for the task.
+
+        Returns:
+            Task: The newly created task.
+
+        Raises:
+            ValueError: If the description is empty or the deadline isn't a datetime.
+        """
+        new_task = Task(self._next_id, description, False, datetime.datetime.now(), deadline)
+        self.tasks.append(new_task)
+        self._by_id[new_task.id] = new_task
+        self._next_id += 1 # Increment for the next task
+        self._append_task(new_task) # Write just the new line to file
+        return new_task
+
+    def bulk_add(self, items: Iterable[tuple[str, datetime.datetime | None]]) -> list[Task]:
+        """
+        Adds many tasks at once, writing them to the file with a single save at the end
+        instead of one write per task.
+
+        Args:
+            items (Iterable[tuple[str, datetime.datetime | None]]): (description, deadline) pairs.
+
+        Returns:
+            list[Task]: The newly created tasks, in input order.
+
+        Raises:
+            ValueError: If an item is invalid. Tasks added before it are kept and saved.
+        """
+        added = []
+        now = datetime.datetime.now()
+        try:
+            for description, deadline in items:
+                new_task = Task(self._next_id, description, False, now, deadline)
+                self.tasks.append(new_task)
+                self._by_id[new_task.id] = new_task
+                self._next_id += 1
+                added.append(new_task)
+        finally:
+            if added:
+                self._dirty = True
+                self.flush()
+        return added
+
+    def remove(self, task_id: int) -> bool:
+        """
+        Removes the task with the given ID.
+
+        Returns:
+            bool: True if a task was removed, False if no task has that ID.
+        """
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return False
+        self.tasks.remove(task)
+        self._mark_dirty()
+        return True
+
+    def complete(self, task_id: int) -> bool:
+        """
+        Marks the task with the given ID as complete.
+
+        Returns:
+            bool: True if the task changed, False if it doesn't exist or was already completed.
+        """
+        task = self._by_id.get(task_id)
+        if task is None or task.is_completed:
+            return False
+        task.is_completed = True
+        self._mark_dirty()
+        return True
+
+    def edit(self, task_id: int, description: str | None = None, deadline: datetime.datetime | None = None,
+             clear_deadline: bool = False, is_completed: bool | None = None) -> bool:
+        """
+        Updates the given fields of a task; arguments left as None are kept.
+
+        Args:
+            task_id (int): The ID of the task to edit.
+            description (str | None): New description; surrounding whitespace is stripped.
+            deadline (datetime.datetime | None): New deadline.
+            clear_deadline (bool): If True, removes the deadline (ignores `deadline`).
+            is_completed (bool | None): New completion status.
+
+        Returns:
+            bool: True if anything changed, False otherwise (including when the task doesn't exist).
+
+        Raises:
+            ValueError: If description is given but empty or only whitespace, as in Task.__init__.
+        """
+        if description is not None:
+            # Checked before touching the task, so a rejected edit changes nothing
+            if not isinstance(description, str) or not (description := description.strip()):
+                raise ValueError("Task description cannot be empty.")
+        task = self._by_id.get(task_id)
+        if task is None:
+            return False
+
+        updated = False
+        if description is not None:
+            task.description = description
+            updated = True
+        if clear_deadline:
+            if task.deadline_datetime is not None:
+                task.deadline_datetime = None
+                updated = True
+        elif deadline is not None:
+            task.deadline_datetime = deadline
+            updated = True
+        if is_completed is not None and is_completed != task.is_completed:
+            task.is_completed = is_completed
+            updated = True
+
+        if updated:
+            self._mark_dirty()
+        return updated
+
+    def clear_completed(self) -> int:
+        """
+        Removes all tasks that are currently marked as completed.
+
+        Returns:
+            int: The number of tasks removed.
+        """
+        initial_count = len(self.tasks)
+        self.tasks = [task for task in self.tasks if not task.is_completed]
+        self._by_id = {task.id: task for task in self.tasks}
+        removed = initial_count - len(self.tasks)
+        if removed:
+            self._mark_dirty()
+        return removed
+
+    def select(self, sort_by: str = 'id', filter_by_status: str = 'all', limit: int | None = None,
+               now: datetime.datetime | None = None) -> list[Task]:
+        """
+        Returns tasks matching a status filter, in sorted order.
+
+        Args:
+            sort_by (str): How to sort tasks ('id', 'creation_date', 'deadline').
+            filter_by_status (str): Which tasks to return ('all', 'active', 'completed', 'overdue').
+            limit (int | None): If given, return only the first `limit` tasks in sort order.
+            now (datetime.datetime | None): Reference time for 'active'/'overdue'; defaults to the current time.
+
+        Returns:
+            list[Task]: The matching tasks.
+        """
+        if now is None:
+            now = datetime.datetime.now()
+
+        if filter_by_status == 'active':
+            # Active means not completed and not overdue (if deadline exists)
+            matches = (t for t in self.tasks if not t.is_completed and (t.deadline_datetime is None or t.deadline_datetime > now))
+        elif filter_by_status == 'completed':
+            matches = (t for t in self.tasks if t.is_completed)
+        elif filter_by_status == 'overdue':
+            # Overdue means not completed and deadline has passed
+            matches = (t for t in self.tasks if not t.is_completed and t.deadline_datetime and t.deadline_datetime <= now)
+        else:
+            matches = iter(self.tasks)
+
+        # Sorting logic
+        if sort_by == 'creation_date':
+            sort_key = lambda t: t.creation_datetime
+        elif sort_by == 'deadline':
+            # Sort by deadline, None deadlines go to the end (False sorts before True)
+            sort_key = lambda t: (t.deadline_datetime is None, t.deadline_datetime or datetime.datetime.min)
+        else: # Default to sort by ID
+            sort_key = lambda t: t.id
+
+        # Filter and sort in one pass; with a limit only the top `limit` tasks are ever kept
+        if limit is not None:
+            return heapq.nsmallest(limit, matches, key=sort_key)
+        return sorted(matches, key=sort_key)
+
+
+
+# --- ToDoListManager Class ---
+class ToDoListManager(TaskEngine):
+    """
+    Interactive console front end for a TaskEngine: prompts for input,
+    calls the engine and prints the results.
+    """
+
     def add_task(self):
         """
         Prompts the user for a task description and an optional deadline.
@@ -257,11 +636,7 @@ class ToDoListManager:
         deadline = _parse_datetime_input("Enter deadline", optional=True)
 
         try:
-            # Create a new Task object with the next available ID and current time
-            new_task = Task(self._next_id, description, False, datetime.datetime.now(), deadline)
-            self.tasks.append(new_task)
-            self._next_id += 1 # Increment for the next task
-            self._save_tasks() # Save changes to file
+            new_task = self.add(description, deadline)
             print(f"Task added: {new_task.description} (ID: {new_task.id})")
         except ValueError as e:
             print(f"Error adding task: {e}")
@@ -288,13 +663,8 @@ class ToDoListManager:
                 return
 
             task_id = int(task_id_input)
-            
-            initial_task_count = len(self.tasks)
-            # Create a new list excluding the task to be removed
-            self.tasks = [task for task in self.tasks if task.id != task_id]
 
-            if len(self.tasks) < initial_task_count:
-                self._save_tasks()
+            if self.remove(task_id):
                 print(f"Task with ID {task_id} removed successfully.")
             else:
                 print(f"Task with ID {task_id} not found.")
@@ -321,21 +691,12 @@ class ToDoListManager:
                 return
 
             task_id = int(task_id_input)
-            found_and_updated = False
-            for task in self.tasks:
-                if task.id == task_id:
-                    if not task.is_completed:
-                        task.is_completed = True # Mark as complete
-                        self._save_tasks()
-                        print(f"Task with ID {task_id} marked as complete.")
-                        found_and_updated = True
-                        break
-                    else:
-                        print(f"Task with ID {task_id} is already completed.")
-                        found_and_updated = True
-                        break
-            if not found_and_updated:
+            if self.complete(task_id):
+                print(f"Task with ID {task_id} marked as complete.")
+            elif self.get(task_id) is None:
                 print(f"Task with ID {task_id} not found.")
+            else:
+                print(f"Task with ID {task_id} is already completed.")
         except ValueError:
             print("Invalid input. Please enter a valid number for the ID.")
         except Exception as e:
@@ -359,11 +720,7 @@ class ToDoListManager:
                 return
 
             task_id = int(task_id_input)
-            task_to_edit: Task | None = None
-            for task in self.tasks:
-                if task.id == task_id:
-                    task_to_edit = task
-                    break
+            task_to_edit = self.get(task_id)
 
             if task_to_edit is None:
                 print(f"Task with ID {task_id} not found.")
@@ -371,42 +728,27 @@ class ToDoListManager:
 
             print(f"\n--- Editing Task ID: {task_to_edit.id} ---")
             print(f"Current Description: {task_to_edit.description}")
-            print(f"Current Deadline: {task_to_edit.deadline_datetime.strftime('%Y-%m-%d %H:%M') if task_to_edit.deadline_datetime else 'N/A'}")
+            print(f"Current Deadline: {task_to_edit.deadline_display}")
             print(f"Current Status: {'Completed' if task_to_edit.is_completed else 'Active'}")
 
-            updated = False
-
             # Edit Description
             new_description = input(f"Enter new description (current: '{task_to_edit.description}', leave blank to keep): ").strip()
-            if new_description:
-                task_to_edit.description = new_description
-                updated = True
 
             # Edit Deadline
-            new_deadline_input = input(f"Enter new deadline (current: '{task_to_edit.deadline_datetime.strftime('%Y-%m-%d %H:%M') if task_to_edit.deadline_datetime else 'N/A'}', YYYY-MM-DD HH:MM, 'clear' to remove, leave blank to keep): ").strip().lower()
-            if new_deadline_input == 'clear':
-                if task_to_edit.deadline_datetime is not None:
-                    task_to_edit.deadline_datetime = None
-                    updated = True
-            elif new_deadline_input:
+            new_deadline = None
+            new_deadline_input = input(f"Enter new deadline (current: '{task_to_edit.deadline_display}', YYYY-MM-DD HH:MM, 'clear' to remove, leave blank to keep): ").strip().lower()
+            if new_deadline_input and new_deadline_input != 'clear':
                 try:
-                    parsed_deadline = datetime.datetime.strptime(new_deadline_input, '%Y-%m-%d %H:%M')
-                    task_to_edit.deadline_datetime = parsed_deadline
-                    updated = True
+                    new_deadline = _parse_fixed_datetime(new_deadline_input)
                 except ValueError:
                     print("Invalid new deadline format. Keeping current deadline.")
 
             # Edit Completion Status
             new_status_input = input(f"Mark as complete? (y/n, current: {'y' if task_to_edit.is_completed else 'n'}, leave blank to keep): ").strip().lower()
-            if new_status_input == 'y' and not task_to_edit.is_completed:
-                task_to_edit.is_completed = True
-                updated = True
-            elif new_status_input == 'n' and task_to_edit.is_completed:
-                task_to_edit.is_completed = False
-                updated = True
+            new_status = {'y': True, 'n': False}.get(new_status_input)
 
-            if updated:
-                self._save_tasks()
+            if self.edit(task_id, new_description or None, new_deadline,
+                         clear_deadline=new_deadline_input == 'clear', is_completed=new_status):
                 print("Task updated successfully!")
             else:
                 print("No changes made to the task.")
@@ -416,58 +758,34 @@ class ToDoListManager:
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
-    def view_all_tasks(self, sort_by: str = 'id', filter_by_status: str = 'all'):
+    def view_all_tasks(self, sort_by: str = 'id', filter_by_status: str = 'all', limit: int | None = None):
         """
         Displays tasks based on sorting and filtering criteria.
 
         Args:
             sort_by (str): How to sort tasks ('id', 'creation_date', 'deadline').
             filter_by_status (str): Which tasks to show ('all', 'active', 'completed', 'overdue').
+            limit (int | None): If given, show only the first `limit` tasks in sort order.
         """
         print("\n--- All Tasks ---")
         if not self.tasks:
             print("No tasks found.")
             return
 
-        filtered_tasks = []
         now = datetime.datetime.now()
+        display_list = self.select(sort_by, filter_by_status, limit, now)
 
-        for task in self.tasks:
-            include_task = False
-            if filter_by_status == 'all':
-                include_task = True
-            elif filter_by_status == 'active':
-                # Active means not completed and not overdue (if deadline exists)
-                if not task.is_completed and (task.deadline_datetime is None or task.deadline_datetime > now):
-                    include_task = True
-            elif filter_by_status == 'completed':
-                if task.is_completed:
-                    include_task = True
-            elif filter_by_status == 'overdue':
-                # Overdue means not completed and deadline has passed
-                if not task.is_completed and task.deadline_datetime and task.deadline_datetime <= now:
-                    include_task = True
-            
-            if include_task:
-                filtered_tasks.append(task)
-
-        if not filtered_tasks:
+        if not display_list:
             print(f"No {filter_by_status} tasks found.")
             return
 
-        # Sorting logic
-        if sort_by == 'creation_date':
-            display_list = sorted(filtered_tasks, key=lambda t: t.creation_datetime)
-        elif sort_by == 'deadline':
-            # Sort by deadline, None deadlines go to the end
-            display_list = sorted(filtered_tasks, key=lambda t: t.deadline_datetime if t.deadline_datetime is not None else datetime.datetime.max)
-        else: # Default to sort by ID
-            display_list = sorted(filtered_tasks, key=lambda t: t.id)
-
-
+        # Build the whole listing first and emit it with a single write
+        out = io.StringIO()
+        separator = "\n" + "-" * 30 + "\n" # Separator for readability
         for task in display_list:
-            print(task)
-            print("-" * 30) # Separator for readability
+            out.write(task.render(now)) # Same clock reading as the filter above
+            out.write(separator)
+        sys.stdout.write(out.getvalue())
 
     def filter_tasks_menu(self):
         """Presents options to filter tasks and calls view_all_tasks with filter."""
@@ -525,27 +843,27 @@ class ToDoListManager:
         Removes all tasks that are currently marked as completed.
         """
         print("\n--- Clear Completed Tasks ---")
-        initial_count = len(self.tasks)
-        self.tasks = [task for task in self.tasks if not task.is_completed]
+        removed = self.clear_completed()
         
-        if len(self.tasks) < initial_count:
-            self._save_tasks()
-            print(f"{initial_count - len(self.tasks)} completed task(s) cleared successfully.")
+        if removed:
+            print(f"{removed} completed task(s) cleared successfully.")
         else:
             print("No completed tasks to clear.")
 
 # --- Main Application Logic ---
+MAIN_MENU = ("\n--- To-Do List App Menu ---\n"
+             "1. Add New Task\n"
+             "2. Remove Task\n"
+             "3. Mark Task as Complete\n"
+             "4. Edit Task\n"
+             "5. View Tasks (with Filter/Sort Options)\n"
+             "6. Clear All Completed Tasks\n"
+             "7. Exit\n"
+             "---------------------------\n")
+
 def display_menu():
     """Displays the main menu options to the user."""
-    print("\n--- To-Do List App Menu ---")
-    print("1. Add New Task")
-    print("2. Remove Task")
-    print("3. Mark Task as Complete")
-    print("4. Edit Task")
-    print("5. View Tasks (with Filter/Sort Options)")
-    print("6. Clear All Completed Tasks")
-    print("7. Exit")
-    print("---------------------------")
+    sys.stdout.write(MAIN_MENU) # One write instead of one per line
 
 def main():
     """
@@ -585,6 +903,7 @@ def main():
         elif choice == '6':
             manager.clear_completed_tasks()
         elif choice == '7':
+            manager.flush() # Save any pending changes before exiting
             print("Exiting To-Do List App. Goodbye!")
             break # Exit the main loop
         else:
@@ -8,13 +8,120 @@ and file handling for data persistence. Passwords are hashed for basic security.
 """
 
 import os
+import re
+import sys
+import hmac
+import json
+import argparse
+import bisect
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TextIO
 import hashlib # For password hashing
 
 # --- Configuration ---
 USERS_FILE = 'users.txt'
 POSTS_FILE = 'posts.txt'
-# Format for users.txt: username:hashed_password
-# Format for posts.txt: username:post_content
+POSTS_PAGE_SIZE = 50 # Posts shown per page in "View all platform posts"
+IO_BUFFER_SIZE = 1 << 20 # 1 MiB read buffers: whole files load in a few large reads
+# Both files are JSON Lines, one record per line:
+#   users.txt: {"u": username, "h": hashed_password}
+#   posts.txt: {"u": username, "c": post_content}
+# Older 'username:value' lines are still read. New and re-hashed records are appended as JSON;
+# when a username appears more than once, its last line wins.
+
+# Rules for new usernames, checked in signup(): 1-64 characters, no surrounding whitespace,
+# no colons (the legacy field separator) or newlines. Accounts and posts loaded from disk
+# only need a non-empty name, so records written before these rules keep loading.
+_USERNAME_RE = re.compile(r'\A[^\s:](?:[^\n:]{0,62}[^\s:])?\Z')
+USERNAME_RULES = "Usernames must be 1-64 characters, without colons, line breaks or leading/trailing spaces."
+
+# scrypt cost parameters for new password hashes. Raising them later is safe:
+# older hashes keep verifying and are re-hashed with the new cost on next login.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+# Successful verifications remembered per process, so repeat logins skip scrypt
+VERIFY_CACHE_SIZE = 1024
+
+# --- Password Hashing Helpers ---
+
+def _hash_password(password: str) -> str:
+    """
+    Hashes a password with scrypt and a fresh random salt.
+
+    Args:
+        password (str): The plain-text password.
+
+    Returns:
+        str: 'scrypt$n$r$p$salt_hex$hash_hex', which embeds everything needed to verify it.
+    """
+    salt = os.urandom(SALT_BYTES)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+def _sha256_hex(password: str) -> str:
+    """Returns the unsalted SHA256 hex digest used by legacy password hashes."""
+    return hashlib.sha256(password.encode('utf-8')).hexdigest()
+
+def _is_legacy_hash(hashed_password: str) -> bool:
+    """Returns True for an unsalted SHA256 hex digest from before scrypt was used."""
+    return len(hashed_password) == 64 and all(c in '0123456789abcdef' for c in hashed_password)
+
+def _check_password(hashed_password: str, password: str) -> bool:
+    """
+    Checks a plain-text password against a stored scrypt or legacy SHA256 hash.
+
+    Args:
+        hashed_password (str): The stored hash.
+        password (str): The plain-text password to check.
+
+    Returns:
+        bool: True if the password matches, False otherwise (including corrupt hashes).
+    """
+    if _is_legacy_hash(hashed_password):
+        # Constant-time comparison so response timing doesn't leak matching prefixes
+        candidate = _sha256_hex(password)
+        return hmac.compare_digest(hashed_password, candidate)
+
+    try:
+        scheme, n, r, p, salt_hex, hash_hex = hashed_password.split('$')
+        if scheme != 'scrypt':
+            return False
+        expected = bytes.fromhex(hash_hex)
+        candidate = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt_hex),
+                                   n=int(n), r=int(r), p=int(p), dklen=len(expected))
+    except ValueError: # Corrupt hash field; treat it as a failed login
+        return False
+    return hmac.compare_digest(expected, candidate)
+
+# The cache never holds plain-text passwords: it maps a stored hash to an HMAC of
+# the password that verified against it, under a key that only lives in this process.
+# Changing a password changes the stored hash, which invalidates its entry.
+_VERIFY_CACHE_KEY = os.urandom(32)
+_verified_cache: dict[str, bytes] = {}
+_verified_cache_lock = threading.Lock() # verify_batch updates the cache from several threads
+
+def _verify_password(hashed_password: str, password: str) -> bool:
+    """
+    Same as _check_password, but answers repeat logins from a small cache of
+    recent successful verifications instead of re-running scrypt.
+    """
+    tag = hmac.new(_VERIFY_CACHE_KEY, password.encode(), hashlib.sha256).digest()
+    cached = _verified_cache.get(hashed_password)
+    if cached is not None and hmac.compare_digest(cached, tag):
+        return True
+
+    if not _check_password(hashed_password, password):
+        return False
+    with _verified_cache_lock:
+        if len(_verified_cache) >= VERIFY_CACHE_SIZE:
+            del _verified_cache[next(iter(_verified_cache))] # Evict the oldest entry
+        _verified_cache[hashed_password] = tag
+    return True
+
 
 # --- Cell 1: User Class ---
 
@@ -22,21 +129,31 @@ class User:
     """
     Represents a social media platform user.
     """
+    __slots__ = ('username', 'hashed_password') # No per-instance __dict__
+
     def __init__(self, username: str, hashed_password: str):
         """
         Initializes a User object.
 
         Args:
             username (str): The user's unique username.
-            hashed_password (str): The SHA256 hashed password for the user.
+            hashed_password (str): The scrypt hash (or a legacy SHA256 hex digest) of the user's password.
         """
-        if not isinstance(username, str) or not username.strip():
+        # Strip the username once, then check and store the stripped value
+        if not isinstance(username, str) or not (username := username.strip()):
             raise ValueError("Username cannot be empty.")
-        if not isinstance(hashed_password, str) or not hashed_password.strip():
+        # Strip the hash once, then check and store the stripped value
+        if not isinstance(hashed_password, str) or not (hashed_password := hashed_password.strip()):
             raise ValueError("Hashed password cannot be empty.")
 
-        self.username = username.strip()
-        self.hashed_password = hashed_password.strip()
+        self.username = sys.intern(username) # Shared with this user's posts and the dict keys
+        self.hashed_password = hashed_password
+
+    def to_file_format(self) -> str:
+        """
+        Converts the user object into a JSON line suitable for saving to file.
+        """
+        return json.dumps({"u": self.username, "h": self.hashed_password}, ensure_ascii=False)
 
     def verify_password(self, password: str) -> bool:
         """
@@ -48,7 +165,17 @@ class User:
         Returns:
             bool: True if the password matches, False otherwise.
         """
-        return self.hashed_password == hashlib.sha256(password.encode()).hexdigest()
+        return _verify_password(self.hashed_password, password)
+
+    def needs_rehash(self) -> bool:
+        """
+        Checks whether the stored hash is a legacy SHA256 digest or uses
+        different scrypt parameters than the current configuration.
+
+        Returns:
+            bool: True if the password should be re-hashed on the next successful login.
+        """
+        return not self.hashed_password.startswith(f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
 
     def __str__(self):
         """Returns a string representation of the User."""
@@ -60,6 +187,8 @@ class Post:
     """
     Represents a single post made by a user.
     """
+    __slots__ = ('username', 'content') # No per-instance __dict__
+
     def __init__(self, username: str, content: str):
         """
         Initializes a Post object.
@@ -68,21 +197,22 @@ class Post:
             username (str): The username of the author of the post.
             content (str): The content of the post.
         """
-        if not isinstance(username, str) or not username.strip():
+        # Strip the username once, then check and store the stripped value
+        if not isinstance(username, str) or not (username := username.strip()):
             raise ValueError("Post author username cannot be empty.")
-        if not isinstance(content, str) or not content.strip():
+        # Strip the content once, then check and store the stripped value
+        if not isinstance(content, str) or not (content := content.strip()):
             raise ValueError("Post content cannot be empty.")
 
-        self.username = username.strip()
-        self.content = content.strip()
+        self.username = sys.intern(username) # One string object per author, however many posts
+        self.content = content
 
     def to_file_format(self) -> str:
         """
         Converts the post object into a string format suitable for saving to file.
         """
-        # Using a simple delimiter for simplicity. For complex content,
-        # one might need more robust serialization (e.g., JSON).
-        return f"{self.username}:{self.content}"
+        # JSON escapes colons, quotes and newlines in the content
+        return json.dumps({"u": self.username, "c": self.content}, ensure_ascii=False)
 
     def __str__(self):
         """Returns a string representation of the Post."""
@@ -90,6 +220,30 @@ class Post:
 
 # --- Cell 3: SocialMediaPlatform Class ---
 
+def _parse_record(line: str, value_key: str) -> tuple[str, str] | None:
+    """
+    Parses one stored line into (username, value).
+
+    Args:
+        line (str): A stripped, non-empty line from the users or posts file.
+        value_key (str): The JSON key of the value ("h" for users, "c" for posts).
+
+    Returns:
+        tuple[str, str] | None: The username and value, or None if the line is malformed.
+    """
+    if line.startswith('{'):
+        try:
+            record = json.loads(line)
+            return record["u"], record[value_key]
+        except (ValueError, KeyError, TypeError):
+            pass # Not a JSON record; a legacy username may start with '{' too
+    parts = line.split(':', 1) # Legacy format: split only on the first colon
+    return (parts[0].strip(), parts[1]) if len(parts) == 2 else None
+
+def _post_author(post: Post) -> str:
+    """Sort key for keeping posts ordered by author."""
+    return post.username
+
 class SocialMediaPlatform:
     """
     Manages user accounts (signup, login) and posts.
@@ -107,6 +261,8 @@ class SocialMediaPlatform:
         self.posts_file = posts_file
         self._users: dict[str, User] = {} # Stores User objects by username
         self._posts: list[Post] = []     # Stores Post objects
+        self._posts_by_user: dict[str, list[Post]] = {} # Same posts grouped by author
+        self._posts_sorted: list[Post] = [] # Same posts kept sorted by author (stable)
 
         self._load_users()
         self._load_posts()
@@ -120,20 +276,23 @@ class SocialMediaPlatform:
             return
 
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(':', 1) # Split only on the first colon
-                    if len(parts) == 2:
-                        username, hashed_password = parts[0], parts[1]
-                        try:
-                            self._users[username] = User(username, hashed_password)
-                        except ValueError as e:
-                            print(f"Warning: Malformed user data on line {line_num} in '{self.users_file}': {e} - skipping line.")
-                    else:
-                        print(f"Warning: Skipping malformed line {line_num} in '{self.users_file}': '{line}' - Expected 'username:hashed_password'.")
+            with open(self.users_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                # One bulk read, split in C. Only on '\n' (text mode already converted line endings):
+                # splitlines() would also break on U+2028, '\x85' etc., which JSON writes unescaped.
+                lines = f.read().split('\n')
+            for line_num, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                record = _parse_record(line, "h")
+                if record is not None:
+                    username, hashed_password = record
+                    try:
+                        self._users[username] = User(username, hashed_password)
+                    except ValueError as e:
+                        print(f"Warning: Malformed user data on line {line_num} in '{self.users_file}': {e} - skipping line.")
+                else:
+                    print(f"Warning: Skipping malformed line {line_num} in '{self.users_file}': '{line}' - Expected a JSON user record.")
             print(f"Users loaded successfully from '{self.users_file}'.")
         except IOError as e:
             print(f"Error loading users from '{self.users_file}': {e}")
@@ -141,19 +300,23 @@ class SocialMediaPlatform:
             print(f"An unexpected error occurred while loading users: {e}")
             self._users = {} # Clear users if unexpected error to prevent corrupted data
 
-    def _save_users(self):
+    def _append_user_to_disk(self, user: User):
         """
-        Saves current user data from memory to the users file.
+        Appends a single user to the end of the users file, so signing up or
+        re-hashing a password at login doesn't rewrite every existing account.
+        A later line for the same username replaces earlier ones when loading.
+        The file is never rewritten, so lines the loader skips are kept as they are.
+
+        Args:
+            user (User): The newly registered or re-hashed user to write.
         """
         try:
-            with open(self.users_file, 'w', encoding='utf-8') as f:
-                for user in self._users.values():
-                    f.write(f"{user.username}:{user.hashed_password}\n")
-            # print(f"Users saved to '{self.users_file}'.")
+            with open(self.users_file, 'a', encoding='utf-8') as f:
+                f.write(user.to_file_format() + '\n')
         except IOError as e:
-            print(f"Error saving users to '{self.users_file}': {e}")
+            print(f"Error saving user to '{self.users_file}': {e}")
         except Exception as e:
-            print(f"An unexpected error occurred while saving users: {e}")
+            print(f"An unexpected error occurred while saving user: {e}")
 
     def _load_posts(self):
         """
@@ -164,40 +327,50 @@ class SocialMediaPlatform:
             return
 
         try:
-            with open(self.posts_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(':', 1) # Split on first colon
-                    if len(parts) == 2:
-                        username, content = parts[0], parts[1]
-                        try:
-                            self._posts.append(Post(username, content))
-                        except ValueError as e:
-                            print(f"Warning: Malformed post data on line {line_num} in '{self.posts_file}': {e} - skipping line.")
-                    else:
-                        print(f"Warning: Skipping malformed line {line_num} in '{self.posts_file}': '{line}' - Expected 'username:content'.")
+            with open(self.posts_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                # One bulk read, split in C. Only on '\n' (text mode already converted line endings):
+                # splitlines() would also break on U+2028, '\x85' etc., which JSON writes unescaped.
+                lines = f.read().split('\n')
+            for line_num, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                record = _parse_record(line, "c")
+                if record is not None:
+                    username, content = record
+                    try:
+                        post = Post(username, content)
+                        self._posts.append(post)
+                        self._posts_by_user.setdefault(post.username, []).append(post)
+                    except ValueError as e:
+                        print(f"Warning: Malformed post data on line {line_num} in '{self.posts_file}': {e} - skipping line.")
+                else:
+                    print(f"Warning: Skipping malformed line {line_num} in '{self.posts_file}': '{line}' - Expected a JSON post record.")
+            self._posts_sorted = sorted(self._posts, key=_post_author) # One sort; inserts keep it ordered
             print(f"Posts loaded successfully from '{self.posts_file}'.")
         except IOError as e:
             print(f"Error loading posts from '{self.posts_file}': {e}")
         except Exception as e:
             print(f"An unexpected error occurred while loading posts: {e}")
             self._posts = [] # Clear posts if unexpected error
+            self._posts_by_user = {}
+            self._posts_sorted = []
 
-    def _save_posts(self):
+    def _append_post_to_disk(self, post: Post):
         """
-        Saves current post data from memory to the posts file.
+        Appends a single post to the end of the posts file, so posting
+        doesn't rewrite every existing post.
+
+        Args:
+            post (Post): The newly created post to write.
         """
         try:
-            with open(self.posts_file, 'w', encoding='utf-8') as f:
-                for post in self._posts:
-                    f.write(post.to_file_format() + '\n')
-            # print(f"Posts saved to '{self.posts_file}'.")
+            with open(self.posts_file, 'a', encoding='utf-8') as f:
+                f.write(post.to_file_format() + '\n')
         except IOError as e:
-            print(f"Error saving posts to '{self.posts_file}': {e}")
+            print(f"Error saving post to '{self.posts_file}': {e}")
         except Exception as e:
-            print(f"An unexpected error occurred while saving posts: {e}")
+            print(f"An unexpected error occurred while saving post: {e}")
 
     def signup(self, username: str, password: str) -> bool:
         """
@@ -210,19 +383,24 @@ class SocialMediaPlatform:
         Returns:
             bool: True if signup is successful, False otherwise (e.g., username taken).
         """
-        if not username.strip() or not password.strip():
+        username = username.strip()
+        if not username or not password.strip():
             print("Username and password cannot be empty.")
             return False
 
-        if username.strip() in self._users:
+        if not _USERNAME_RE.match(username):
+            print(f"Error: Invalid username. {USERNAME_RULES}")
+            return False
+
+        if username in self._users:
             print(f"Error: Username '{username}' already taken. Please choose another.")
             return False
 
-        hashed_password = hashlib.sha256(password.encode()).hexdigest()
+        hashed_password = _hash_password(password)
         try:
-            new_user = User(username.strip(), hashed_password)
+            new_user = User(username, hashed_password)
             self._users[new_user.username] = new_user
-            self._save_users()
+            self._append_user_to_disk(new_user)
             print(f"User '{new_user.username}' signed up successfully!")
             return True
         except ValueError as e:
@@ -243,18 +421,46 @@ class SocialMediaPlatform:
         Returns:
             User | None: The User object if login is successful, None otherwise.
         """
-        if not username.strip() or not password.strip():
+        username = username.strip()
+        if not username or not password.strip():
             print("Username and password cannot be empty.")
             return None
 
-        user = self._users.get(username.strip())
+        user = self._users.get(username)
         if user and user.verify_password(password):
+            if user.needs_rehash():
+                # Lazy migration: we only have the plain-text password now, at login.
+                # Appended rather than rewriting the file; _load_users keeps the last line per username.
+                user.hashed_password = _hash_password(password)
+                self._append_user_to_disk(user)
             print(f"Welcome, {user.username}! You are logged in.")
             return user
         else:
             print("Invalid username or password.")
             return None
 
+    def verify_batch(self, credentials: Iterable[tuple[str, str]], max_workers: int | None = None) -> list[bool]:
+        """
+        Checks many (username, password) pairs at once, e.g. for a bulk import or an admin tool.
+        hashlib.scrypt releases the GIL while hashing, so a thread pool spreads the work
+        across CPU cores without the start-up and pickling cost of separate processes.
+        Unlike login, this prints nothing and never re-hashes legacy passwords.
+
+        Args:
+            credentials (Iterable[tuple[str, str]]): The (username, password) pairs to check.
+            max_workers (int | None): Thread count; None lets the executor choose.
+
+        Returns:
+            list[bool]: One result per pair, in input order.
+        """
+        def verify_one(credential: tuple[str, str]) -> bool:
+            username, password = credential
+            user = self._users.get(username.strip())
+            return user is not None and user.verify_password(password)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(verify_one, credentials))
+
     def create_post(self, author_username: str, content: str):
         """
         Creates a new post for a given user.
@@ -263,14 +469,17 @@ class SocialMediaPlatform:
             author_username (str): The username of the post author.
             content (str): The content of the post.
         """
-        if not content.strip():
+        content = content.strip()
+        if not content:
             print("Post content cannot be empty.")
             return
 
         try:
             new_post = Post(author_username, content)
             self._posts.append(new_post)
-            self._save_posts()
+            self._posts_by_user.setdefault(new_post.username, []).append(new_post)
+            bisect.insort(self._posts_sorted, new_post, key=_post_author) # After equal authors, like a stable sort
+            self._append_post_to_disk(new_post)
             print("Post created successfully!")
         except ValueError as e:
             print(f"Error creating post: {e}")
@@ -287,7 +496,7 @@ class SocialMediaPlatform:
         Returns:
             list[Post]: A list of Post objects by the specified user.
         """
-        return [post for post in self._posts if post.username == username]
+        return list(self._posts_by_user.get(username, ())) # Return a copy
 
     def get_all_posts(self) -> list[Post]:
         """
@@ -295,6 +504,19 @@ class SocialMediaPlatform:
         """
         return list(self._posts) # Return a copy
 
+    def iter_posts_sorted(self, offset: int = 0, limit: int = POSTS_PAGE_SIZE) -> Iterator[Post]:
+        """
+        Yields one page of posts sorted by author username, without copying the rest.
+
+        Args:
+            offset (int): How many posts to skip from the start.
+            limit (int): The maximum number of posts to yield.
+
+        Returns:
+            Iterator[Post]: The posts on the requested page.
+        """
+        return itertools.islice(self._posts_sorted, offset, offset + limit)
+
 # --- Cell 4: Main Application Logic ---
 
 def display_main_menu():
@@ -314,25 +536,54 @@ def display_logged_in_menu(username: str):
     print("4. Logout")
     print("----------------------------------")
 
-def main():
+def _line_reader(stream: TextIO) -> Callable[[str], str]:
     """
-    The main function to run the social media application.
+    Returns an input()-like function that reads lines from the given stream,
+    so a scripted session is read through one buffered file instead of a TTY.
+
+    Args:
+        stream (TextIO): The open file to read commands from.
+
+    Returns:
+        Callable[[str], str]: Prints the prompt and returns the next line; raises EOFError at the end.
     """
-    platform = SocialMediaPlatform()
+    def read_line(prompt: str = '') -> str:
+        sys.stdout.write(prompt)
+        line = stream.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\r\n')
+    return read_line
+
+def run_session(platform: SocialMediaPlatform, read_line: Callable[[str], str] = input):
+    """
+    Runs the menu loop until the user exits or input runs out.
+
+    Args:
+        platform (SocialMediaPlatform): The platform to operate on.
+        read_line (Callable[[str], str]): Where answers come from; input() by default.
+    """
+    try:
+        _menu_loop(platform, read_line)
+    except EOFError: # Script (or piped stdin) ended without choosing Exit
+        print("\nEnd of input. Goodbye!")
+
+def _menu_loop(platform: SocialMediaPlatform, read_line: Callable[[str], str]):
+    """The main and logged-in menus; every answer is read through read_line."""
     current_user: User | None = None
 
     while True:
         if current_user is None:
             display_main_menu()
-            choice = input("Enter your choice: ").strip()
+            choice = read_line("Enter your choice: ").strip()
 
             if choice == '1': # Login
-                username = input("Enter username: ").strip()
-                password = input("Enter password: ").strip()
+                username = read_line("Enter username: ").strip()
+                password = read_line("Enter password: ").strip()
                 current_user = platform.login(username, password)
             elif choice == '2': # Sign Up
-                username = input("Enter new username: ").strip()
-                password = input("Enter new password: ").strip()
+                username = read_line("Enter new username: ").strip()
+                password = read_line("Enter new password: ").strip()
                 if platform.signup(username, password):
                     pass # User signed up, optionally prompt to login now
             elif choice == '3': # Exit
@@ -342,10 +593,10 @@ def main():
                 print("Invalid choice. Please enter 1, 2, or 3.")
         else: # User is logged in
             display_logged_in_menu(current_user.username)
-            choice = input("Enter your choice: ").strip()
+            choice = read_line("Enter your choice: ").strip()
 
             if choice == '1': # Create Post
-                content = input("Enter your post content: ").strip()
+                content = read_line("Enter your post content: ").strip()
                 platform.create_post(current_user.username, content)
             elif choice == '2': # View My Posts
                 my_posts = platform.get_user_posts(current_user.username)
@@ -356,19 +607,43 @@ def main():
                 else:
                     print("You haven't made any posts yet.")
             elif choice == '3': # View All Platform Posts
-                all_posts = platform.get_all_posts()
-                if all_posts:
-                    print("\n--- All Posts on the Platform ---")
-                    # Sort posts by username for easier viewing, or by a timestamp if we added one
-                    for i, post in enumerate(sorted(all_posts, key=lambda p: p.username), 1):
+                offset = 0
+                while True:
+                    # Fetch one extra post to know whether another page follows
+                    page = list(platform.iter_posts_sorted(offset, POSTS_PAGE_SIZE + 1))
+                    if not page:
+                        print("No posts have been made on the platform yet.")
+                        break
+                    if offset == 0:
+                        print("\n--- All Posts on the Platform ---")
+                    for i, post in enumerate(page[:POSTS_PAGE_SIZE], offset + 1):
                         print(f"{i}. {post}")
-                else:
-                    print("No posts have been made on the platform yet.")
+                    offset += POSTS_PAGE_SIZE
+                    if len(page) <= POSTS_PAGE_SIZE or read_line("Show more posts? (y/n): ").strip().lower() != 'y':
+                        break
             elif choice == '4': # Logout
                 print(f"Logging out {current_user.username}...")
                 current_user = None
             else:
                 print("Invalid choice. Please enter 1, 2, 3, or 4.")
 
+def main(script_path: str | None = None):
+    """
+    The main function to run the social media application.
+
+    Args:
+        script_path (str | None): If given, read menu answers from this file instead of the keyboard.
+    """
+    platform = SocialMediaPlatform()
+
+    if script_path is None:
+        run_session(platform)
+    else:
+        with open(script_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as script:
+            run_session(platform, _line_reader(script))
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Basic Social Media Platform")
+    parser.add_argument('--script', metavar='FILE',
+                        help="read menu answers from FILE, one per line, instead of prompting")
+    main(parser.parse_args().script)
@@ -1,19 +1,130 @@
+import io
 import os
+import sys
+import mmap
+import time
+import atexit
+import operator
+import hmac
 import hashlib # For password hashing
 import datetime # For recording transaction timestamps
 
 # --- Configuration ---
 USERS_FILE = 'users.txt'
 TRANSACTIONS_FILE = 'transactions.txt'
+# New transactions are buffered and written together once either limit is reached
+APPEND_FLUSH_BYTES = 64 * 1024
+APPEND_FLUSH_INTERVAL = 0.1 # seconds since the oldest buffered transaction was queued
 
 # Valid categories for employment
-VALID_CATEGORIES = ['freelancer', 'full time', 'part time']
+VALID_CATEGORIES = ('freelancer', 'full time', 'part time')
+# Valid transaction types
+VALID_TRANSACTION_TYPES = ('Income', 'Expense')
+# Hashed copies for membership tests; the tuples above keep the display order
+_VALID_CATEGORY_SET = frozenset(VALID_CATEGORIES)
+_VALID_TX_TYPES = frozenset(VALID_TRANSACTION_TYPES)
+
+# scrypt cost parameters for new password hashes. Older hashes (including legacy
+# unsalted SHA256 ones) keep working and are re-hashed with these on next login.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+
+# Login results are remembered so repeat attempts skip the KDF
+VERIFY_CACHE_TTL = 3 * 60 * 60 # seconds a successful login stays cached
+FAILED_LOGIN_CACHE_TTL = 30    # seconds a failed attempt stays cached (repeats are rejected cheaply)
+VERIFY_CACHE_SIZE = 1024
+
+# hashlib.sha256 (used for legacy hashes) is OpenSSL's implementation whenever Python is built with OpenSSL,
+# which uses the CPU's SHA extensions where available. Bound once to skip the lookup per call.
+_SHA256_CTOR = hashlib.sha256
 
 # --- Helper Functions ---
 
 def _hash_password(password: str) -> str:
-    """Hashes a password using SHA256 for basic security."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hashes a password with scrypt and a random salt; returns 'scrypt$n$r$p$salt_hex$hash_hex'."""
+    salt = os.urandom(SALT_BYTES)
+    digest = hashlib.scrypt(password.encode('utf-8'), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+def _is_legacy_hash(hashed_password: str) -> bool:
+    """Returns True for an unsalted SHA256 hex digest from before scrypt was used."""
+    return len(hashed_password) == 64 and all(c in '0123456789abcdef' for c in hashed_password)
+
+def _parse_hash(hashed_password: str) -> tuple | None:
+    """
+    Decodes a stored hash into (scrypt_params, expected_digest), where scrypt_params is
+    (salt, n, r, p), or None for a legacy SHA256 hash. Returns None if the field is corrupt.
+    """
+    if _is_legacy_hash(hashed_password):
+        return None, bytes.fromhex(hashed_password)
+    try:
+        scheme, n, r, p, salt_hex, hash_hex = hashed_password.split('$')
+        if scheme != 'scrypt':
+            return None
+        return (bytes.fromhex(salt_hex), int(n), int(r), int(p)), bytes.fromhex(hash_hex)
+    except ValueError:
+        return None
+
+def _check_password(parsed_hash: tuple | None, password: str) -> bool:
+    """Checks a plain-text password against a hash decoded by _parse_hash, in constant time."""
+    if parsed_hash is None: # Corrupt hash field; treat it as a failed login
+        return False
+    scrypt_params, expected = parsed_hash
+    password_bytes = password.encode('utf-8')
+    if scrypt_params is None:
+        candidate = _SHA256_CTOR(password_bytes).digest() # Raw 32 bytes, no hex formatting
+    else:
+        salt, n, r, p = scrypt_params
+        try:
+            candidate = hashlib.scrypt(password_bytes, salt=salt, n=n, r=r, p=p, dklen=len(expected))
+        except ValueError: # Parameters scrypt rejects, e.g. n not a power of two
+            return False
+    return hmac.compare_digest(expected, candidate)
+
+# Transaction times are kept as integer microseconds since this naive epoch (local wall-clock time,
+# like datetime.now()), so no timezone conversion ever shifts what is displayed
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+def _datetime_to_us(value: datetime.datetime) -> int:
+    """Converts a naive datetime to microseconds since _EPOCH."""
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+def _iso_to_us(value: str) -> int:
+    """
+    Parses a timestamp written by Transaction.to_file_format ('YYYY-MM-DDTHH:MM:SS' with
+    optional '.ffffff') straight to microseconds since _EPOCH by slicing its fixed-width
+    fields, without building a datetime. Any other shape goes through datetime.fromisoformat.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 date and time.
+    """
+    length = len(value)
+    if ((length == 19 or (length == 26 and value[19] == '.' and value[20:].isdigit()))
+            and value[4] == '-' and value[7] == '-' and value[10] == 'T' and value[13] == ':' and value[16] == ':'
+            and (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]).isdigit()):
+        hour, minute, second = int(value[11:13]), int(value[14:16]), int(value[17:19])
+        if hour < 24 and minute < 60 and second < 60:
+            # date() rejects out-of-range fields such as month 13
+            days = datetime.date(int(value[0:4]), int(value[5:7]), int(value[8:10])).toordinal() - _EPOCH_ORDINAL
+            micros = int(value[20:]) if length == 26 else 0
+            return ((days * 24 + hour) * 60 + minute) * 60_000_000 + second * 1_000_000 + micros
+    return _datetime_to_us(datetime.datetime.fromisoformat(value))
+
+def _read_lines(path: str) -> list[str]:
+    """
+    Reads a whole UTF-8 file through a memory map and decodes it in one pass,
+    returning its lines without the trailing newline.
+    """
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return [] # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    return text.split('\n') # Only '\n' ends a line, as when iterating the file
 
 def _display_message(message: str):
     """Prints a message with a separator for better readability."""
@@ -28,13 +139,15 @@ class User:
     Represents a user of the financial tracking system.
     Stores personal details and hashed password.
     """
+    __slots__ = ('account_no', '_hashed_password', '_parsed_hash', 'name', 'category')
+
     def __init__(self, account_no: str, hashed_password: str, name: str, category: str):
         """
         Initializes a User object.
 
         Args:
             account_no (str): Unique account number for the user.
-            hashed_password (str): SHA256 hashed password.
+            hashed_password (str): scrypt hash (or legacy SHA256 hex digest) of the password.
             name (str): User's full name.
             category (str): Employment category (e.g., 'freelancer').
         """
@@ -43,9 +156,26 @@ class User:
         self.name = name
         self.category = category
 
+    @property
+    def hashed_password(self) -> str:
+        return self._hashed_password
+
+    @hashed_password.setter
+    def hashed_password(self, value: str):
+        self._hashed_password = value
+        self._parsed_hash = _parse_hash(value) # Decoded once here, not on every login attempt
+
     def verify_password(self, password: str) -> bool:
         """Checks if the provided plain-text password matches the stored hashed password."""
-        return self.hashed_password == _hash_password(password)
+        return _check_password(self._parsed_hash, password)
+
+    def needs_rehash(self) -> bool:
+        """Checks if the stored hash is legacy SHA256 or uses other scrypt parameters than configured."""
+        return not self.hashed_password.startswith(f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
+
+    def set_password(self, password: str):
+        """Replaces the stored hash with a fresh scrypt hash of the given password."""
+        self.hashed_password = _hash_password(password)
 
     def to_file_format(self) -> str:
         """Converts user data to a string format for saving to file."""
@@ -63,33 +193,45 @@ class Transaction:
     """
     Represents a single financial transaction (income or expense).
     """
-    def __init__(self, account_no: str, timestamp: datetime.datetime,
+    __slots__ = ('account_no', 'timestamp_us', 'type', 'amount', 'description', '_serialized')
+    _SIGN = {'Income': '+', 'Expense': '-'} # Sign shown in front of the amount, by type
+
+    def __init__(self, account_no: str, timestamp: datetime.datetime | int,
                  trans_type: str, amount: float, description: str):
         """
         Initializes a Transaction object.
 
         Args:
             account_no (str): The account number of the user who made the transaction.
-            timestamp (datetime.datetime): The exact date and time of the transaction.
+            timestamp (datetime.datetime | int): The exact date and time of the transaction,
+                as a naive datetime or as microseconds since 1970-01-01 00:00.
             trans_type (str): Type of transaction ('Income' or 'Expense').
             amount (float): The amount of the transaction.
             description (str): A brief description of the transaction.
         """
         self.account_no = account_no
-        self.timestamp = timestamp
+        self.timestamp_us = timestamp if isinstance(timestamp, int) else _datetime_to_us(timestamp)
         self.type = trans_type # 'Income' or 'Expense'
         self.amount = amount
         self.description = description
+        self._serialized = None # to_file_format() result, built on first use
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """The transaction time as a datetime, built on demand from timestamp_us."""
+        return _EPOCH + datetime.timedelta(microseconds=self.timestamp_us)
 
     def to_file_format(self) -> str:
-        """Converts transaction data to a string format for saving to file."""
-        # Use ISO format for datetime to ensure accurate parsing later
-        return f"{self.account_no},{self.timestamp.isoformat()},{self.type},{self.amount},{self.description}"
+        """Converts transaction data to a string format for saving to file. Transactions never change, so this is computed once."""
+        if self._serialized is None:
+            # Use ISO format for datetime to ensure accurate parsing later
+            self._serialized = f"{self.account_no},{self.timestamp.isoformat()},{self.type},{self.amount},{self.description}"
+        return self._serialized
 
     def __str__(self):
         """String representation for displaying transaction details."""
         timestamp_str = self.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-        sign = '+' if self.type == 'Income' else '-'
+        sign = self._SIGN[self.type]
         return (f"  [{timestamp_str}] | Type: {self.type} | Amount: {sign}${self.amount:,.2f} | "
                 f"Description: {self.description}")
 
@@ -107,7 +249,18 @@ class FinancialTracker:
         self.users_file = users_file
         self.transactions_file = transactions_file
         self._users: dict[str, User] = {}          # Stores User objects by account number
-        self._transactions: list[Transaction] = [] # Stores all Transaction objects
+        self._users_dirty = False                  # True while _users has changes not yet saved
+        self._by_account: dict[str, list[Transaction]] = {} # Transactions, partitioned by account_no
+        self._totals: dict[str, tuple[float, float]] = {}   # Running (income, expense) per account_no
+        # (stored hash, HMAC of attempted password) -> (result, time checked). Keyed by the
+        # stored hash so a password change or re-signup invalidates old entries, and by an
+        # HMAC under a per-process key so no plain-text password is ever kept.
+        self._verify_cache: dict[tuple[str, bytes], tuple[bool, float]] = {}
+        self._verify_cache_key = os.urandom(32)
+        self._append_buf = bytearray() # Encoded transaction lines not yet written
+        self._append_fh = None         # Unbuffered handle, opened on first write and kept open
+        self._buffered_since = None    # When the oldest buffered line was queued (monotonic)
+        atexit.register(self.close) # Never lose buffered transactions on exit
 
         self._load_users()
         self._load_transactions()
@@ -120,20 +273,19 @@ class FinancialTracker:
             return
 
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line: continue # Skip empty lines
-
-                    parts = line.split(':', 3) # Split into at most 4 parts
-                    if len(parts) == 4:
-                        account_no, hashed_password, name, category = parts
-                        if category not in VALID_CATEGORIES:
-                            print(f"Warning: Invalid category '{category}' for user '{account_no}' on line {line_num}. Skipping.")
-                            continue
-                        self._users[account_no] = User(account_no, hashed_password, name, category)
-                    else:
-                        print(f"Warning: Malformed user data on line {line_num} in '{self.users_file}': '{line}'. Skipping.")
+            for line_num, line in enumerate(_read_lines(self.users_file), 1):
+                line = line.strip()
+                if not line: continue # Skip empty lines
+
+                parts = line.split(':', 3) # Split into at most 4 parts
+                if len(parts) == 4:
+                    account_no, hashed_password, name, category = parts
+                    if category not in _VALID_CATEGORY_SET:
+                        print(f"Warning: Invalid category '{category}' for user '{account_no}' on line {line_num}. Skipping.")
+                        continue
+                    self._users[account_no] = User(account_no, hashed_password, name, category)
+                else:
+                    print(f"Warning: Malformed user data on line {line_num} in '{self.users_file}': '{line}'. Skipping.")
             _display_message(f"Users loaded successfully from '{self.users_file}'. Total: {len(self._users)}.")
         except IOError as e:
             _display_message(f"Error loading users from '{self.users_file}': {e}")
@@ -143,11 +295,20 @@ class FinancialTracker:
             self._users = {}
 
     def _save_users(self):
-        """Saves current user data from memory to the users file (overwrites)."""
+        """
+        Saves current user data from memory to the users file, if anything changed since the last save.
+        Writes a temporary file and swaps it in, so a crash mid-save never leaves a truncated users file behind.
+        """
+        if not self._users_dirty:
+            return
+        tmp_filename = self.users_file + '.tmp'
         try:
-            with open(self.users_file, 'w', encoding='utf-8') as f:
-                for user in self._users.values():
-                    f.write(user.to_file_format() + '\n')
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.write(''.join(user.to_file_format() + '\n' for user in self._users.values())) # One write for the whole file
+                f.flush()
+                os.fsync(f.fileno()) # Make sure the save actually reached the disk
+            os.replace(tmp_filename, self.users_file) # Atomic: readers see the old file or the new one
+            self._users_dirty = False
             # print(f"Users saved to '{self.users_file}'.") # Uncomment for debugging
         except IOError as e:
             _display_message(f"Error saving users to '{self.users_file}': {e}")
@@ -156,56 +317,99 @@ class FinancialTracker:
 
     def _load_transactions(self):
         """Loads transaction data from the transactions file into memory."""
-        self._transactions = [] # Clear existing transactions before loading
+        self._by_account = {} # Clear existing transactions before loading
+        self._totals = {}
         if not os.path.exists(self.transactions_file) or os.path.getsize(self.transactions_file) == 0:
             _display_message(f"No existing transactions file found or '{self.transactions_file}' is empty. Starting with no transactions.")
             return
 
         try:
-            with open(self.transactions_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line: continue
-
-                    parts = line.split(',', 4) # Split into at most 5 parts
-                    if len(parts) == 5:
-                        try:
-                            account_no = parts[0]
-                            timestamp = datetime.datetime.fromisoformat(parts[1])
-                            trans_type = parts[2]
-                            amount = float(parts[3])
-                            description = parts[4]
-
-                            # Basic validation for loaded transaction
-                            if trans_type not in ['Income', 'Expense'] or amount < 0:
-                                print(f"Warning: Invalid transaction data on line {line_num} for user '{account_no}'. Skipping.")
-                                continue
-                            
-                            self._transactions.append(Transaction(account_no, timestamp, trans_type, amount, description))
-                        except (ValueError, TypeError) as e:
-                            print(f"Warning: Malformed transaction data on line {line_num} in '{self.transactions_file}': {e}. Skipping.")
-                    else:
-                        print(f"Warning: Malformed transaction data on line {line_num} in '{self.transactions_file}': '{line}'. Skipping.")
-            _display_message(f"Transactions loaded successfully from '{self.transactions_file}'. Total: {len(self._transactions)}.")
+            for line_num, line in enumerate(_read_lines(self.transactions_file), 1):
+                line = line.strip()
+                if not line: continue
+
+                parts = line.split(',', 4) # Split into at most 5 parts
+                if len(parts) == 5:
+                    try:
+                        account_no = parts[0]
+                        timestamp = _iso_to_us(parts[1])
+                        trans_type = parts[2]
+                        amount = float(parts[3])
+                        description = parts[4]
+
+                        # Basic validation for loaded transaction
+                        if trans_type not in _VALID_TX_TYPES or amount < 0:
+                            print(f"Warning: Invalid transaction data on line {line_num} for user '{account_no}'. Skipping.")
+                            continue
+                        
+                        self._index_transaction(Transaction(account_no, timestamp, trans_type, amount, description))
+                    except (ValueError, TypeError) as e:
+                        print(f"Warning: Malformed transaction data on line {line_num} in '{self.transactions_file}': {e}. Skipping.")
+                else:
+                    print(f"Warning: Malformed transaction data on line {line_num} in '{self.transactions_file}': '{line}'. Skipping.")
+            _display_message(f"Transactions loaded successfully from '{self.transactions_file}'. Total: {sum(map(len, self._by_account.values()))}.")
         except IOError as e:
             _display_message(f"Error loading transactions from '{self.transactions_file}': {e}")
-            self._transactions = []
+            self._by_account = {}
+            self._totals = {}
         except Exception as e:
             _display_message(f"An unexpected error occurred while loading transactions: {e}")
-            self._transactions = []
+            self._by_account = {}
+            self._totals = {}
+
 
+    def _index_transaction(self, transaction: Transaction):
+        """Files a transaction under its account and adds it to that account's running totals."""
+        account_no = transaction.account_no
+        self._by_account.setdefault(account_no, []).append(transaction)
+        income, expense = self._totals.get(account_no, (0.0, 0.0))
+        if transaction.type == 'Income':
+            income += transaction.amount
+        else:
+            expense += transaction.amount
+        self._totals[account_no] = (income, expense)
 
     def _append_transaction_to_file(self, transaction: Transaction):
-        """Appends a single transaction to the transactions file."""
+        """
+        Queues a single transaction for the transactions file. Queued lines are written
+        together once they reach APPEND_FLUSH_BYTES or the oldest has waited
+        APPEND_FLUSH_INTERVAL, checked on each call. Nothing writes a partial batch on its
+        own, so callers adding one transaction at a time must call flush_transactions().
+        """
         try:
-            with open(self.transactions_file, 'a', encoding='utf-8') as f: # 'a' for append mode
-                f.write(transaction.to_file_format() + '\n')
-            # print(f"Transaction appended to '{self.transactions_file}'.") # Debugging
-        except IOError as e:
-            _display_message(f"Error appending transaction to '{self.transactions_file}': {e}")
+            now = time.monotonic()
+            if not self._append_buf:
+                self._buffered_since = now
+            self._append_buf += (transaction.to_file_format() + '\n').encode('utf-8')
+            if (len(self._append_buf) >= APPEND_FLUSH_BYTES
+                    or now - self._buffered_since >= APPEND_FLUSH_INTERVAL):
+                self.flush_transactions()
         except Exception as e:
             _display_message(f"An unexpected error occurred while appending transaction: {e}")
 
+    def flush_transactions(self):
+        """Writes any buffered transactions to the end of the transactions file."""
+        if not self._append_buf:
+            return
+        try:
+            if self._append_fh is None:
+                self._append_fh = open(self.transactions_file, 'ab', buffering=0) # 'a' for append mode
+            written = 0
+            while written < len(self._append_buf): # Unbuffered writes may be partial
+                written += self._append_fh.write(self._append_buf[written:])
+            self._append_buf.clear()
+            self._buffered_since = None
+            # print(f"Transactions appended to '{self.transactions_file}'.") # Debugging
+        except IOError as e:
+            _display_message(f"Error appending transaction to '{self.transactions_file}': {e}")
+
+    def close(self):
+        """Writes any buffered transactions and unsaved users, then closes the transactions file. Safe to call twice."""
+        self._save_users() # Retries a save that failed earlier; no-op otherwise
+        self.flush_transactions()
+        if self._append_fh is not None:
+            self._append_fh.close()
+            self._append_fh = None
 
     def signup(self) -> bool:
         """
@@ -234,7 +438,7 @@ class FinancialTracker:
 
         while True:
             category = input(f"Enter your Category ({'/'.join(VALID_CATEGORIES)}): ").strip().lower()
-            if category in VALID_CATEGORIES:
+            if category in _VALID_CATEGORY_SET:
                 break
             else:
                 print(f"Invalid category. Please choose from {', '.join(VALID_CATEGORIES)}.")
@@ -243,6 +447,7 @@ class FinancialTracker:
         try:
             new_user = User(account_no, hashed_password, name, category)
             self._users[account_no] = new_user
+            self._users_dirty = True
             self._save_users() # Save updated users list to file
             _display_message(f"Account '{account_no}' created successfully! Please login.")
             return True
@@ -253,6 +458,26 @@ class FinancialTracker:
             _display_message(f"An unexpected error occurred during signup: {e}")
             return False
 
+    def _verify_credentials(self, user: User, password: str) -> bool:
+        """
+        Verifies a login attempt, answering repeats from a short-lived cache instead of running scrypt.
+        Successes are cached for VERIFY_CACHE_TTL seconds, failures for FAILED_LOGIN_CACHE_TTL.
+        """
+        tag = hmac.new(self._verify_cache_key, password.encode('utf-8'), hashlib.sha256).digest()
+        key = (user.hashed_password, tag)
+        now = time.monotonic()
+        cached = self._verify_cache.get(key)
+        if cached is not None:
+            result, checked_at = cached
+            if now - checked_at < (VERIFY_CACHE_TTL if result else FAILED_LOGIN_CACHE_TTL):
+                return result
+
+        result = user.verify_password(password)
+        if cached is None and len(self._verify_cache) >= VERIFY_CACHE_SIZE:
+            del self._verify_cache[next(iter(self._verify_cache))] # Evict the oldest entry
+        self._verify_cache[key] = (result, now)
+        return result
+
     def login(self) -> User | None:
         """
         Authenticates a user. Returns the User object if successful, None otherwise.
@@ -262,7 +487,12 @@ class FinancialTracker:
         password = input("Enter your Password: ").strip()
 
         user = self._users.get(account_no)
-        if user and user.verify_password(password):
+        if user and self._verify_credentials(user, password):
+            if user.needs_rehash():
+                # Lazy migration: the plain-text password is only available here, at login
+                user.set_password(password)
+                self._users_dirty = True
+                self._save_users()
             _display_message(f"Welcome, {user.name}! You are logged in.")
             return user
         else:
@@ -287,7 +517,7 @@ class FinancialTracker:
 
         while True:
             trans_type = input("Enter Type (Income/Expense): ").strip().capitalize()
-            if trans_type in ['Income', 'Expense']:
+            if trans_type in _VALID_TX_TYPES:
                 break
             else:
                 print("Invalid type. Please enter 'Income' or 'Expense'.")
@@ -302,8 +532,9 @@ class FinancialTracker:
 
         try:
             new_transaction = Transaction(current_user_account_no, timestamp, trans_type, amount, description)
-            self._transactions.append(new_transaction)
-            self._append_transaction_to_file(new_transaction) # Append to file immediately
+            self._index_transaction(new_transaction)
+            self._append_transaction_to_file(new_transaction)
+            self.flush_transactions() # Interactive additions go to disk before the confirmation
             _display_message("Transaction added successfully!")
             print(new_transaction) # Show the added transaction
         except ValueError as e:
@@ -319,30 +550,31 @@ class FinancialTracker:
         """
         _display_message(f"--- Financial Report for Account: {current_user_account_no} ---")
         
-        user_transactions = [
-            t for t in self._transactions if t.account_no == current_user_account_no
-        ]
+        user_transactions = self._by_account.get(current_user_account_no)
 
         if not user_transactions:
             print("No transactions recorded for this account yet.")
             print("Current Balance: $0.00")
             return
 
-        total_income = sum(t.amount for t in user_transactions if t.type == 'Income')
-        total_expense = sum(t.amount for t in user_transactions if t.type == 'Expense')
+        total_income, total_expense = self._totals[current_user_account_no]
         current_balance = total_income - total_expense
 
-        print(f"Total Income:    +${total_income:,.2f}")
-        print(f"Total Expenses:  -${total_expense:,.2f}")
-        print(f"Current Balance:  ${current_balance:,.2f}")
-        print("\n--- Transaction History ---")
+        # Build the whole report in memory and hand it to stdout in one write
+        out = io.StringIO()
+        out.write(f"Total Income:    +${total_income:,.2f}\n")
+        out.write(f"Total Expenses:  -${total_expense:,.2f}\n")
+        out.write(f"Current Balance:  ${current_balance:,.2f}\n")
+        out.write("\n--- Transaction History ---\n")
         
         # Sort transactions by timestamp for chronological display
-        sorted_transactions = sorted(user_transactions, key=lambda t: t.timestamp)
+        sorted_transactions = sorted(user_transactions, key=operator.attrgetter('timestamp_us'))
 
         for i, transaction in enumerate(sorted_transactions):
-            print(f"Transaction {i+1}:")
-            print(transaction)
+            out.write(f"Transaction {i+1}:\n")
+            out.write(str(transaction))
+            out.write('\n')
+        sys.stdout.write(out.getvalue())
         
         _display_message("Report End.")
 
@@ -357,43 +589,46 @@ def run_app():
     tracker = FinancialTracker() # Initialize the tracker, which loads existing data
     current_user: User | None = None # Stores the currently logged-in user
 
-    while True:
-        if current_user is None: # Not logged in
-            print("\n--- Main Menu ---")
-            print("1. Login")
-            print("2. Sign Up (Create New Account)")
-            print("3. Exit")
-            choice = input("Enter your choice: ").strip()
-
-            if choice == '1':
-                current_user = tracker.login()
-            elif choice == '2':
-                tracker.signup()
-            elif choice == '3':
-                _display_message("Exiting Personal Finance Tracker. Goodbye!")
-                break # Exit the main loop
-            else:
-                _display_message("Invalid choice. Please enter 1, 2, or 3.")
-        else: # Logged in
-            print(f"\n--- Logged in as: {current_user.name} ({current_user.account_no}) ---")
-            print("1. Add New Transaction")
-            print("2. View Financial Report")
-            print("3. View My Personal Details")
-            print("4. Logout")
-            choice = input("Enter your choice: ").strip()
-
-            if choice == '1':
-                tracker.add_transaction(current_user.account_no)
-            elif choice == '2':
-                tracker.view_financial_report(current_user.account_no)
-            elif choice == '3':
-                _display_message("--- Your Personal Details ---")
-                print(current_user)
-            elif choice == '4':
-                _display_message(f"Logging out {current_user.name}...")
-                current_user = None # Clear current user to return to login menu
-            else:
-                _display_message("Invalid choice. Please enter 1, 2, 3, or 4.")
+    try:
+        while True:
+            if current_user is None: # Not logged in
+                print("\n--- Main Menu ---")
+                print("1. Login")
+                print("2. Sign Up (Create New Account)")
+                print("3. Exit")
+                choice = input("Enter your choice: ").strip()
+
+                if choice == '1':
+                    current_user = tracker.login()
+                elif choice == '2':
+                    tracker.signup()
+                elif choice == '3':
+                    _display_message("Exiting Personal Finance Tracker. Goodbye!")
+                    break # Exit the main loop
+                else:
+                    _display_message("Invalid choice. Please enter 1, 2, or 3.")
+            else: # Logged in
+                print(f"\n--- Logged in as: {current_user.name} ({current_user.account_no}) ---")
+                print("1. Add New Transaction")
+                print("2. View Financial Report")
+                print("3. View My Personal Details")
+                print("4. Logout")
+                choice = input("Enter your choice: ").strip()
+
+                if choice == '1':
+                    tracker.add_transaction(current_user.account_no)
+                elif choice == '2':
+                    tracker.view_financial_report(current_user.account_no)
+                elif choice == '3':
+                    _display_message("--- Your Personal Details ---")
+                    print(current_user)
+                elif choice == '4':
+                    _display_message(f"Logging out {current_user.name}...")
+                    current_user = None # Clear current user to return to login menu
+                else:
+                    _display_message("Invalid choice. Please enter 1, 2, 3, or 4.")
+    finally:
+        tracker.close() # Also on Ctrl+C or an unexpected error
 
 # --- Run the application ---
 if __name__ == "__main__":